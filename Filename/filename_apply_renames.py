@@ -20,9 +20,16 @@ from datetime import datetime
 import csv
 import sqlite3
 import shutil
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, Tuple
 
+PYARROW_OK = find_spec("pyarrow") is not None
+
+# Below this size the plain csv pass is quick enough that importing
+# pyarrow for the summary would cost more than it saves.
+_ARROW_SUMMARY_MIN_BYTES = 16 * 1024 * 1024
+
 
 TRUTHY = {"y", "yes", "true", "1", "apply", "ok"}
 
@@ -83,6 +90,31 @@ def update_mik_paths(db_path: Path, mapping: list[tuple[Path, Path]], table: str
     return updated, not_found
 
 
+def print_csv_summary(csv_path: Path) -> None:
+    """Up-front row/marked counts for big CSVs via pyarrow's multithreaded
+    reader; the rename loop itself still streams with csv.DictReader."""
+    if not PYARROW_OK:
+        return
+    try:
+        if csv_path.stat().st_size < _ARROW_SUMMARY_MIN_BYTES:
+            return
+        import pyarrow.csv as pa_csv
+
+        table = pa_csv.read_csv(
+            str(csv_path),
+            read_options=pa_csv.ReadOptions(block_size=64 << 20),
+        )
+        # utf-8-sig CSVs leave a BOM on the first column name
+        names = {c.lstrip("\ufeff"): c for c in table.column_names}
+        marked = 0
+        if "apply" in names:
+            marked = sum(1 for v in table.column(names["apply"]).to_pylist() if _is_truthy(v))
+        print(f"CSV rows: {table.num_rows}")
+        print(f"Rows marked apply: {marked}")
+    except Exception as e:
+        print(f"CSV summary skipped: {e}")
+
+
 def rename_from_csv(csv_path: Path, apply_changes: bool) -> Tuple[int, int, int, list[tuple[Path, Path]]]:
     if not csv_path.exists():
         raise FileNotFoundError(csv_path)
@@ -101,6 +133,7 @@ def rename_from_csv(csv_path: Path, apply_changes: bool) -> Tuple[int, int, int,
         scanned = 0
         to_apply = 0
         renamed = 0
+        mapping: list[tuple[Path, Path]] = []
 
         for row in reader:
             scanned += 1
@@ -153,6 +186,7 @@ def main(argv=None) -> int:
     apply_changes = bool(args.apply)
     csv_path = Path(args.csv)
 
+    print_csv_summary(csv_path)
     scanned, to_apply, renamed, mapping = rename_from_csv(csv_path, apply_changes=apply_changes)
 
     print(f"Scanned rows: {scanned}")
@@ -27,6 +27,7 @@ import argparse
 import csv
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -269,6 +270,11 @@ def iter_audio_files(root: Path, recursive: bool) -> Iterable[Path]:
                 yield p
 
 
+def _scan_one(path: Path) -> Tuple[Path, Optional[str], List[str]]:
+    suggested_core, reasons = suggest_filename(path)
+    return path, suggested_core, reasons
+
+
 def current_stem(path: Path) -> str:
     return path.stem
 
@@ -287,6 +293,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--out", required=True, help="Output CSV path")
     ap.add_argument("--recursive", action="store_true", help="Scan subfolders")
     ap.add_argument("--m3u8", action="store_true", help="Also write a review playlist (.m3u8) next to CSV")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=min(8, os.cpu_count() or 4),
+        help="Number of parallel tag readers (1 disables parallelism)",
+    )
     args = ap.parse_args(argv)
 
     root = Path(args.root)
@@ -298,9 +310,20 @@ def main(argv: Optional[List[str]] = None) -> int:
     scanned = 0
     changed = 0
 
-    for p in iter_audio_files(root, recursive=args.recursive):
+    # Tag reading is per-file and I/O-bound, so files are scanned on a
+    # thread pool; ex.map preserves input order for the CSV. Threads
+    # rather than processes because the GUI imports this module under a
+    # synthetic name, which child processes cannot unpickle.
+    paths = list(iter_audio_files(root, recursive=args.recursive))
+    workers = max(1, args.workers)
+    if workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            scan_results = list(ex.map(_scan_one, paths))
+    else:
+        scan_results = [_scan_one(p) for p in paths]
+
+    for p, suggested_core, reasons in scan_results:
         scanned += 1
-        suggested_core, reasons = suggest_filename(p)
         if suggested_core is None:
             rows.append(
                 {
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-r"""
-miK_prune_missing.py
+r"""
+miK_prune_missing.py
 
 Scans a Mixed In Key SQLite database and deletes track rows whose file path no longer exists.
 
@@ -55,8 +55,15 @@ def backup_db(db_path: Path) -> Path:
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
-    # Using URI mode lets us open read-only if needed (not used here, but handy)
-    conn = sqlite3.connect(str(db_path))
+    # URI mode opens read-write without creating a new DB on a typo'd
+    # path, and the larger statement cache keeps the per-id DELETE
+    # compiled across the whole run.
+    try:
+        conn = sqlite3.connect(
+            db_path.resolve().as_uri() + "?mode=rw", uri=True, cached_statements=256
+        )
+    except sqlite3.OperationalError:
+        conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -170,8 +177,8 @@ def pick_table_and_columns(
 
 def normalize_db_path_value(val: str) -> str:
     """
-    Mixed In Key may store:
-    - Windows paths: C:\\Music\\track.flac
+    Mixed In Key may store:
+    - Windows paths: C:\\Music\\track.flac
     - file URIs: file:///C:/Music/track.flac
     - urlencoded paths
     """
@@ -284,11 +291,13 @@ def main() -> int:
             print("Re-run with: --apply")
             return 0
 
-        # Delete rows by id
+        # Delete rows by id in one batch
         conn.execute("BEGIN")
         try:
-            for rid, _pth in missing:
-                conn.execute(f"DELETE FROM {table} WHERE {id_col} = ?", (rid,))
+            conn.executemany(
+                f"DELETE FROM {table} WHERE {id_col} = ?",
+                [(rid,) for rid, _pth in missing],
+            )
             conn.commit()
         except Exception:
             conn.rollback()
@@ -298,6 +307,10 @@ def main() -> int:
         return 0
 
     finally:
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         conn.close()
 
 
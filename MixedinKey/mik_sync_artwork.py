@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-r"""
-mik_sync_artwork.py
+r"""
+mik_sync_artwork.py
 
 Fills Mixed In Key album art (Song.Artwork BLOB) from embedded artwork in audio files.
 
@@ -197,7 +197,14 @@ def main() -> int:
 
     apply_changes = bool(args.apply) and not bool(args.dry_run)
 
-    conn = sqlite3.connect(str(db_path))
+    # URI mode opens read-write without creating a new DB on a typo'd
+    # path; the larger statement cache keeps the artwork UPDATE compiled.
+    try:
+        conn = sqlite3.connect(
+            db_path.resolve().as_uri() + "?mode=rw", uri=True, cached_statements=256
+        )
+    except sqlite3.OperationalError:
+        conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     try:
         # Confirm expected schema
@@ -304,6 +311,10 @@ def main() -> int:
 
         return 0
     finally:
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         conn.close()
 
 
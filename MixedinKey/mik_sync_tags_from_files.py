@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-r"""
-mik_sync_tags_from_files.py
+r"""
+mik_sync_tags_from_files.py
 
 Syncs tags from audio files into a Mixed In Key SQLite database.
 
@@ -26,6 +26,7 @@ import os
 import shutil
 import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -75,7 +76,15 @@ def backup_db(db_path: Path) -> Path:
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db_path))
+    # URI mode opens read-write without creating a new DB on a typo'd
+    # path; the larger statement cache keeps the batched UPDATE variants
+    # compiled across flushes.
+    try:
+        conn = sqlite3.connect(
+            db_path.resolve().as_uri() + "?mode=rw", uri=True, cached_statements=256
+        )
+    except sqlite3.OperationalError:
+        conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -100,6 +109,8 @@ def pick_song_table(conn: sqlite3.Connection) -> str:
 
     best = None  # (score, table)
     for t in tables:
+        if t == "mik_sync_cache":
+            continue  # our own sidecar table
         cols = [c.lower() for c in table_columns(conn, t)]
         score = 0
         if "file" in cols or "path" in cols or "location" in cols:
@@ -214,6 +225,12 @@ def main() -> int:
     ap.add_argument("--report", default=None, help="Write a CSV report of changes to this file.")
     ap.add_argument("--limit", type=int, default=0, help="Process only the first N rows (0 means all).")
     ap.add_argument("--allow-empty", action="store_true", help="Allow overwriting DB with empty file tags.")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=min(8, os.cpu_count() or 4),
+        help="Number of parallel tag readers (1 disables parallelism).",
+    )
 
     args = ap.parse_args()
 
@@ -275,26 +292,78 @@ def main() -> int:
 
         changes: List[Dict[str, str]] = []
         missing_files = 0
+        unchanged_files = 0
         scanned = 0
 
+        # Sidecar cache of (mtime_ns, size) per track from earlier apply
+        # runs; files that have not changed since skip the mutagen parse.
+        cache: Dict[Any, Tuple[int, int]] = {}
+        try:
+            cache = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute("SELECT track_id, mtime_ns, size FROM mik_sync_cache")
+            }
+        except sqlite3.OperationalError:
+            pass  # no cache table yet, first run
+
+        # First pass resolves paths and drops missing or unchanged files;
+        # tag reading is I/O-bound per file, so the survivors are parsed on
+        # a thread pool while the SQLite writes below stay on this thread.
+        work: List[Tuple[Any, Path, Tuple[int, int]]] = []
+        for r in rows:
+            scanned += 1
+            raw_path = r[file_col]
+            norm_path = normalize_db_path_value(raw_path)
+            if not norm_path:
+                continue
+
+            try:
+                st = os.stat(norm_path)
+            except OSError:
+                missing_files += 1
+                continue
+
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if cache.get(r[id_col]) == stat_key:
+                unchanged_files += 1
+                continue
+
+            work.append((r, Path(norm_path), stat_key))
+
+        workers = max(1, args.workers)
+        if workers > 1 and len(work) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                tag_results = list(ex.map(read_file_tags, (p for _r, p, _k in work)))
+        else:
+            tag_results = [read_file_tags(p) for _r, p, _k in work]
+
         if apply_changes:
+            # WAL plus relaxed sync keeps fsync out of the hot path while
+            # the single transaction below still commits atomically. Set
+            # after tag reading so the write transaction opens late.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-131072")
             conn.execute("BEGIN")
 
-        try:
-            for r in rows:
-                scanned += 1
-                rid = r[id_col]
-                raw_path = r[file_col]
-                norm_path = normalize_db_path_value(raw_path)
-                if not norm_path:
-                    continue
+        # Updates are buffered per SET clause (rows can differ in which
+        # columns changed) and issued with executemany in 1000-row chunks.
+        pending: Dict[str, List[List[str]]] = {}
 
-                p = Path(norm_path)
-                if not p.exists():
-                    missing_files += 1
-                    continue
+        def flush_pending(set_clause: str):
+            params = pending.pop(set_clause, None)
+            if params:
+                conn.executemany(
+                    f"UPDATE {song_table} SET {set_clause} WHERE {id_col} = ?", params
+                )
+
+        cache_updates: List[Tuple[Any, int, int]] = []
 
-                file_tags = read_file_tags(p)
+        try:
+            for (r, p, stat_key), file_tags in zip(work, tag_results):
+                rid = r[id_col]
+                cache_updates.append((rid, stat_key[0], stat_key[1]))
 
                 update_pairs: Dict[str, str] = {}
                 for field in tracked_fields:
@@ -324,11 +393,27 @@ def main() -> int:
 
                 if apply_changes:
                     set_clause = ", ".join([f"{c} = ?" for c in update_pairs.keys()])
-                    params = list(update_pairs.values()) + [rid]
-                    conn.execute(f"UPDATE {song_table} SET {set_clause} WHERE {id_col} = ?", params)
+                    batch = pending.setdefault(set_clause, [])
+                    batch.append(list(update_pairs.values()) + [rid])
+                    if len(batch) >= 1000:
+                        flush_pending(set_clause)
 
             if apply_changes:
+                for set_clause in list(pending):
+                    flush_pending(set_clause)
                 conn.commit()
+                # Only apply runs record the cache: after a dry-run the DB
+                # still differs from the files, so nothing may be skipped.
+                if cache_updates:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS mik_sync_cache "
+                        "(track_id INTEGER PRIMARY KEY, mtime_ns INTEGER, size INTEGER)"
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO mik_sync_cache VALUES (?, ?, ?)",
+                        cache_updates,
+                    )
+                    conn.commit()
         except Exception:
             if apply_changes:
                 conn.rollback()
@@ -336,6 +421,7 @@ def main() -> int:
 
         print(f"Total rows scanned: {scanned}")
         print(f"Missing files skipped: {missing_files}")
+        print(f"Unchanged files skipped: {unchanged_files}")
         print(f"Field changes detected: {len(changes)}")
 
         if args.report:
@@ -356,6 +442,10 @@ def main() -> int:
         return 0
 
     finally:
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         conn.close()
 
 
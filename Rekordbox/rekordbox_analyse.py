@@ -27,6 +27,7 @@ import csv
 import hashlib
 import json
 import math
+import mmap
 import os
 import re
 import sys
@@ -39,19 +40,17 @@ from urllib.parse import unquote, urlparse
 
 import xml.etree.ElementTree as ET
 
-try:
-    import openpyxl
-    from openpyxl.utils import get_column_letter
-    from openpyxl.worksheet.worksheet import Worksheet
-    OPENPYXL_OK = True
-except Exception:
-    OPENPYXL_OK = False
+from importlib.util import find_spec
 
-try:
-    from mutagen import File as MutagenFile
-    MUTAGEN_OK = True
-except Exception:
-    MUTAGEN_OK = False
+# Optional dependencies are probed without importing them, so cold start
+# stays stdlib-only; the actual imports happen inside the branches that
+# need each package.
+OPENPYXL_OK = find_spec("openpyxl") is not None
+MUTAGEN_OK = find_spec("mutagen") is not None
+XLSXWRITER_OK = find_spec("xlsxwriter") is not None
+PANDAS_OK = find_spec("pandas") is not None
+PYARROW_OK = find_spec("pyarrow") is not None
+LXML_OK = find_spec("lxml") is not None
 
 
 # ---------------------------
@@ -122,17 +121,26 @@ def fileurl_to_path(loc: str) -> str:
     return path.replace("/", os.sep)
 
 def sha1_bytes(b: bytes) -> str:
-    return hashlib.sha1(b).hexdigest()
+    # Single-call hash over the full buffer; usedforsecurity=False lets
+    # OpenSSL pick the hardware (SHA-NI) implementation where available.
+    return hashlib.sha1(b, usedforsecurity=False).hexdigest()
 
 def sha1_file(fp: Path, chunk: int = 1024 * 1024) -> str:
-    h = hashlib.sha1()
     with fp.open("rb") as f:
+        # mmap lets hashlib read straight from the page cache with no
+        # intermediate Python buffers; empty files cannot be mapped.
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha1(mm, usedforsecurity=False).hexdigest()
+        except (ValueError, OSError):
+            pass
+        h = hashlib.sha1(usedforsecurity=False)
         while True:
             data = f.read(chunk)
             if not data:
                 break
             h.update(data)
-    return h.hexdigest()
+        return h.hexdigest()
 
 def load_settings(settings_path: Optional[Path]) -> Dict[str, Any]:
     if not settings_path:
@@ -148,12 +156,69 @@ def ensure_outdir(outdir: Path) -> Path:
     outdir.mkdir(parents=True, exist_ok=True)
     return outdir
 
-def write_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in fieldnames})
+def iter_files(root: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (basename_lower, full_path) for every file under root.
+    os.scandir reuses the directory entry's type info, so this avoids
+    the per-entry Path object and extra stat that rglob would cost.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from iter_files(entry.path)
+                    elif entry.is_file():
+                        yield entry.name.lower(), entry.path
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+# Cells containing any of these need RFC 4180 quoting; everything else
+# can be joined and encoded directly.
+_CSV_UNSAFE = re.compile(r'[",\n\r]')
+
+def _csv_cell(v: Any) -> str:
+    s = v if isinstance(v, str) else str(v)
+    if _CSV_UNSAFE.search(s) is None:
+        return s
+    return '"' + s.replace('"', '""') + '"'
+
+def write_csv(path: Path, rows: List[Any], fieldnames: List[str]) -> None:
+    """
+    Rows can be dicts keyed by fieldname or sequences in fieldname order
+    (the big extracts accumulate columns and zip them at write time).
+    """
+    as_dicts = bool(rows) and isinstance(rows[0], dict)
+    if PYARROW_OK:
+        # pyarrow serialises columns in C, much faster than csv.DictWriter
+        # on the big extracts (artwork scan, missing files, MIK compare).
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+
+            if as_dicts:
+                columns = {name: [str(r.get(name, "")) for r in rows] for name in fieldnames}
+            else:
+                columns = {name: [str(r[i]) for r in rows] for i, name in enumerate(fieldnames)}
+            opts = pa_csv.WriteOptions(quoting_style="needed")
+            pa_csv.write_csv(pa.table(columns), str(path), write_options=opts)
+            return
+        except Exception:
+            pass
+    # Binary mode with a 1 MiB buffer skips the TextIOWrapper encoder on
+    # every row; cells are escaped by hand, csv.writer-compatible.
+    cell = _csv_cell
+    with path.open("wb", buffering=1 << 20) as f:
+        write = f.write
+        write((",".join(map(cell, fieldnames)) + "\r\n").encode("utf-8"))
+        if as_dicts:
+            for r in rows:
+                write((",".join(cell(r.get(k, "")) for k in fieldnames) + "\r\n").encode("utf-8"))
+        else:
+            for r in rows:
+                write((",".join(map(cell, r)) + "\r\n").encode("utf-8"))
 
 
 # ---------------------------
@@ -207,44 +272,60 @@ class Playlist:
 # XML parsing
 # ---------------------------
 
+def _iterparse(xml_path: Path):
+    """Streaming start/end parse context: lxml when installed (noticeably
+    faster on multi-hundred-MB exports), stdlib ElementTree otherwise."""
+    if LXML_OK:
+        from lxml import etree
+
+        return etree.iterparse(str(xml_path), events=("start", "end"))
+    return ET.iterparse(str(xml_path), events=("start", "end"))
+
+
 def iter_tracks(xml_path: Path) -> Iterator[Track]:
     # Track elements live under COLLECTION/TRACK
-    ctx = ET.iterparse(str(xml_path), events=("start", "end"))
+    ctx = _iterparse(xml_path)
     _, root = next(ctx)  # type: ignore[misc]
     in_collection = False
 
     for event, elem in ctx:
-        tag = elem.tag.upper()
+        tag = elem.tag
+        if not isinstance(tag, str):
+            # lxml yields comments/processing instructions too
+            continue
+        tag = tag.upper()
         if event == "start" and tag == "COLLECTION":
             in_collection = True
         elif event == "end" and tag == "COLLECTION":
             in_collection = False
 
         if event == "end" and in_collection and tag == "TRACK":
-            a = elem.attrib
-            loc = a.get("Location", "") or a.get("location", "")
+            # Attribute values arrive as str already; binding .get once and
+            # skipping the str() wrappers trims the per-track extract cost.
+            get = elem.attrib.get
+            loc = get("Location", "") or get("location", "")
             loc_path = fileurl_to_path(loc)
             t = Track(
-                track_id=str(a.get("TrackID", "")),
-                name=str(a.get("Name", "")),
-                artist=str(a.get("Artist", "")),
-                album=str(a.get("Album", "")),
-                remixer=str(a.get("Remixer", "")),
-                mix=str(a.get("Mix", "")),
-                label=str(a.get("Label", "")),
-                genre=str(a.get("Genre", "")),
-                year=safe_int(a.get("Year", 0), 0),
-                date_added=str(a.get("DateAdded", "")),
-                bpm=safe_float(a.get("AverageBpm", 0.0), 0.0),
-                key=str(a.get("Tonality", "")),
-                kind=str(a.get("Kind", "")),
-                size=safe_int(a.get("Size", 0), 0),
-                duration=safe_int(a.get("TotalTime", 0), 0),
-                bitrate=safe_int(a.get("BitRate", 0), 0),
-                samplerate=safe_int(a.get("SampleRate", 0), 0),
-                rating=str(a.get("Rating", "")),
-                playcount=safe_int(a.get("PlayCount", 0), 0),
-                comments=str(a.get("Comments", "")),
+                track_id=get("TrackID", ""),
+                name=get("Name", ""),
+                artist=get("Artist", ""),
+                album=get("Album", ""),
+                remixer=get("Remixer", ""),
+                mix=get("Mix", ""),
+                label=get("Label", ""),
+                genre=get("Genre", ""),
+                year=safe_int(get("Year"), 0),
+                date_added=get("DateAdded", ""),
+                bpm=safe_float(get("AverageBpm"), 0.0),
+                key=get("Tonality", ""),
+                kind=get("Kind", ""),
+                size=safe_int(get("Size"), 0),
+                duration=safe_int(get("TotalTime"), 0),
+                bitrate=safe_int(get("BitRate"), 0),
+                samplerate=safe_int(get("SampleRate"), 0),
+                rating=get("Rating", ""),
+                playcount=safe_int(get("PlayCount"), 0),
+                comments=get("Comments", ""),
                 location_url=loc,
                 location_path=loc_path,
             )
@@ -254,7 +335,7 @@ def iter_tracks(xml_path: Path) -> Iterator[Track]:
 
 def parse_playlists(xml_path: Path) -> List[Playlist]:
     playlists: List[Playlist] = []
-    ctx = ET.iterparse(str(xml_path), events=("start", "end"))
+    ctx = _iterparse(xml_path)
     _, root = next(ctx)  # type: ignore[misc]
     in_playlists = False
     stack: List[Tuple[str, Dict[str, str]]] = []
@@ -265,7 +346,10 @@ def parse_playlists(xml_path: Path) -> List[Playlist]:
         return "/".join(names)
 
     for event, elem in ctx:
-        tag = elem.tag.upper()
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        tag = tag.upper()
         if event == "start" and tag == "PLAYLISTS":
             in_playlists = True
         elif event == "end" and tag == "PLAYLISTS":
@@ -319,6 +403,22 @@ def parse_playlists(xml_path: Path) -> List[Playlist]:
 # MIK CSV parsing (best-effort)
 # ---------------------------
 
+MIK_PATH_COLS = ["path", "file", "filename", "location", "filepath", "file path"]
+MIK_BPM_COLS = ["bpm", "tempo"]
+MIK_KEY_COLS = ["key", "camelot", "tonality"]
+
+def find_mik_col(cols: List[str], cands: List[str]) -> Optional[str]:
+    for cand in cands:
+        for c in cols:
+            if c.lower() == cand.lower():
+                return c
+    # contains match
+    for cand in cands:
+        for c in cols:
+            if cand.lower() in c.lower():
+                return c
+    return None
+
 def read_mik_csv(mik_csv: Path) -> Dict[str, Dict[str, Any]]:
     """
     Returns dict keyed by normalized file path.
@@ -327,23 +427,10 @@ def read_mik_csv(mik_csv: Path) -> Dict[str, Dict[str, Any]]:
     with mik_csv.open("r", encoding="utf-8", errors="ignore", newline="") as f:
         reader = csv.DictReader(f)
         cols = [c or "" for c in (reader.fieldnames or [])]
-        lower = [c.lower() for c in cols]
-
-        def find_col(cands: List[str]) -> Optional[str]:
-            for cand in cands:
-                for c in cols:
-                    if c.lower() == cand.lower():
-                        return c
-            # contains match
-            for cand in cands:
-                for c in cols:
-                    if cand.lower() in c.lower():
-                        return c
-            return None
 
-        path_col = find_col(["path", "file", "filename", "location", "filepath", "file path"])
-        bpm_col = find_col(["bpm", "tempo"])
-        key_col = find_col(["key", "camelot", "tonality"])
+        path_col = find_mik_col(cols, MIK_PATH_COLS)
+        bpm_col = find_mik_col(cols, MIK_BPM_COLS)
+        key_col = find_mik_col(cols, MIK_KEY_COLS)
 
         data: Dict[str, Dict[str, Any]] = {}
         for row in reader:
@@ -352,36 +439,162 @@ def read_mik_csv(mik_csv: Path) -> Dict[str, Dict[str, Any]]:
             if not p:
                 continue
             k = p.lower()
+            key = (row.get(key_col, "") if key_col else "") or ""
             data[k] = {
                 "path": p,
                 "bpm": safe_float(row.get(bpm_col, ""), 0.0) if bpm_col else 0.0,
-                "key": (row.get(key_col, "") if key_col else "") or "",
+                "key": key,
+                # normalised once at load so the compare loop does not
+                # re-run the norm_key regexes per pair
+                "key_norm": norm_key(key) if key.strip() else "",
                 "row": row,
             }
         return data
 
 
+def compare_mik_pandas(tracks: List[Track], mik_csv: Path) -> List[Tuple[Any, ...]]:
+    """
+    Vectorised Rekordbox vs MIK compare: one outer merge on the normalized
+    path key instead of per-row dict lookups. Much faster on large catalogues.
+    """
+    import numpy as np
+    import pandas as pd
+
+    mik_df = pd.read_csv(mik_csv, dtype=str, keep_default_na=False,
+                         encoding="utf-8", encoding_errors="ignore")
+    cols = [str(c) for c in mik_df.columns]
+    path_col = find_mik_col(cols, MIK_PATH_COLS)
+    bpm_col = find_mik_col(cols, MIK_BPM_COLS)
+    key_col = find_mik_col(cols, MIK_KEY_COLS)
+
+    raw = mik_df[path_col].astype(str) if path_col else pd.Series([], dtype=str)
+    mik_path = raw.str.replace("/", os.sep, regex=False).str.replace("\\\\", "\\", regex=False).str.strip()
+    mik = pd.DataFrame({
+        "path_key": mik_path.str.lower(),
+        "MIK_Path": mik_path,
+        "MIK_BPM": pd.to_numeric(mik_df[bpm_col], errors="coerce").fillna(0.0) if bpm_col else 0.0,
+        "MIK_Key": mik_df[key_col].astype(str).str.strip() if key_col else "",
+    })
+    mik = mik[mik["path_key"] != ""].drop_duplicates("path_key", keep="last")
+
+    rb_tracks = [t for t in tracks if t.location_path]
+    rb = pd.DataFrame({
+        "path_key": [t.location_path.lower() for t in rb_tracks],
+        "TrackID": [t.track_id for t in rb_tracks],
+        "Artist": [t.artist for t in rb_tracks],
+        "Title": [t.name for t in rb_tracks],
+        "RB_Path": [t.location_path for t in rb_tracks],
+        "RB_BPM": [t.bpm for t in rb_tracks],
+        "RB_Key": [t.key for t in rb_tracks],
+    })
+    rb = rb.drop_duplicates("path_key", keep="last")
+
+    merged = rb.merge(mik, on="path_key", how="outer", indicator=True)
+    merged = merged.fillna({"TrackID": "", "Artist": "", "Title": "", "RB_Path": "",
+                            "RB_Key": "", "MIK_Path": "", "MIK_Key": "",
+                            "RB_BPM": 0.0, "MIK_BPM": 0.0})
+
+    both = (merged["_merge"] == "both").to_numpy()
+    rb_bpm = merged["RB_BPM"].to_numpy(dtype=float)
+    mik_bpm = merged["MIK_BPM"].to_numpy(dtype=float)
+    bpm_diff = both & (rb_bpm > 0) & (mik_bpm > 0) & (np.abs(rb_bpm - mik_bpm) >= 0.75)
+
+    rb_key = merged["RB_Key"].astype(str)
+    mik_key = merged["MIK_Key"].astype(str)
+    key_diff = (both
+                & (rb_key.str.strip() != "").to_numpy()
+                & (mik_key != "").to_numpy()
+                & (rb_key.map(norm_key) != mik_key.map(norm_key)).to_numpy())
+
+    status = np.select(
+        [bpm_diff & key_diff, bpm_diff, key_diff],
+        ["BPM diff, Key diff", "BPM diff", "Key diff"],
+        default="",
+    )
+
+    mik_rows: List[Tuple[Any, ...]] = []
+    for r in merged[(merged["_merge"] == "left_only").to_numpy()].itertuples(index=False):
+        mik_rows.append(("Missing in MIK", r.TrackID, r.Artist, r.Title,
+                         r.RB_Path, "", r.RB_BPM, "", r.RB_Key, ""))
+    for r in merged[(merged["_merge"] == "right_only").to_numpy()].itertuples(index=False):
+        mik_rows.append(("Missing in Rekordbox", "", "", "",
+                         "", r.MIK_Path, "", r.MIK_BPM, "", r.MIK_Key))
+    diff_mask = status != ""
+    for s, r in zip(status[diff_mask], merged[diff_mask].itertuples(index=False)):
+        mik_rows.append((s, r.TrackID, r.Artist, r.Title,
+                         r.RB_Path, r.MIK_Path, r.RB_BPM, r.MIK_BPM,
+                         r.RB_Key, r.MIK_Key))
+    return mik_rows
+
+
+def compare_mik_rows(tracks: List[Track], mik_csv: Path) -> List[Tuple[Any, ...]]:
+    """Row-by-row fallback compare, used when pandas is not installed."""
+    mik = read_mik_csv(mik_csv)
+    rb_paths = { (t.location_path or "").lower(): t for t in tracks if t.location_path }
+    # Dict-view intersection runs in C, so the single pass below does one
+    # cheap set probe per track instead of a dict lookup per loop.
+    both = rb_paths.keys() & mik.keys()
+    missing_in_mik: List[Tuple[Any, ...]] = []
+    diffs: List[Tuple[Any, ...]] = []
+    for pth, t in rb_paths.items():
+        if pth not in both:
+            missing_in_mik.append(("Missing in MIK", t.track_id, t.artist, t.name,
+                                   t.location_path, "", t.bpm, "", t.key, ""))
+            continue
+        m = mik[pth]
+        mbpm = safe_float(m.get("bpm", 0.0), 0.0)
+        mkey = (m.get("key", "") or "").strip()
+        status = []
+        if mbpm and t.bpm and abs(mbpm - t.bpm) >= 0.75:
+            status.append("BPM diff")
+        if mkey and t.key and m.get("key_norm", "") != norm_key(t.key):
+            status.append("Key diff")
+        if status:
+            diffs.append((", ".join(status), t.track_id, t.artist, t.name,
+                          t.location_path, m.get("path", ""), t.bpm, mbpm,
+                          t.key, mkey))
+    mik_rows = missing_in_mik
+    # missing in RB
+    for pth, m in mik.items():
+        if pth not in both:
+            mik_rows.append(("Missing in Rekordbox", "", "", "",
+                             "", m.get("path", ""), "", m.get("bpm", ""),
+                             "", m.get("key", "")))
+    mik_rows.extend(diffs)
+    return mik_rows
+
+
+def compare_mik(tracks: List[Track], mik_csv: Path) -> List[Tuple[Any, ...]]:
+    if PANDAS_OK:
+        try:
+            return compare_mik_pandas(tracks, mik_csv)
+        except Exception as e:
+            print(f"[WARN] Vectorised MIK compare failed ({e}), falling back to row-by-row.")
+    return compare_mik_rows(tracks, mik_csv)
+
+
 # ---------------------------
 # Artwork scan
 # ---------------------------
 
-def extract_embedded_art_sha1(fp: Path) -> Tuple[bool, Optional[str], Optional[int]]:
+def extract_embedded_art(fp: str) -> Optional[bytes]:
     """
-    Returns (has_art, sha1, bytes_len)
+    Returns the embedded artwork bytes, or None when the file has none.
     """
     if not MUTAGEN_OK:
-        return (False, None, None)
+        return None
     try:
-        mf = MutagenFile(str(fp))
+        from mutagen import File as MutagenFile
+
+        mf = MutagenFile(fp)
         if mf is None:
-            return (False, None, None)
+            return None
 
         # FLAC
         if hasattr(mf, "pictures") and getattr(mf, "pictures"):
             pics = getattr(mf, "pictures")
             if pics:
-                b = pics[0].data
-                return (True, sha1_bytes(b), len(b))
+                return pics[0].data
 
         # MP3 ID3 APIC
         if hasattr(mf, "tags") and mf.tags:
@@ -392,12 +605,12 @@ def extract_embedded_art_sha1(fp: Path) -> Tuple[bool, Optional[str], Optional[i
                     apic = tags.get(k)
                     b = getattr(apic, "data", None)
                     if b:
-                        return (True, sha1_bytes(b), len(b))
+                        return b
 
         # AIFF/WAV may store in tags too (less common)
-        return (False, None, None)
+        return None
     except Exception:
-        return (False, None, None)
+        return None
 
 
 # ---------------------------
@@ -405,6 +618,8 @@ def extract_embedded_art_sha1(fp: Path) -> Tuple[bool, Optional[str], Optional[i
 # ---------------------------
 
 def autosize(ws: Worksheet, max_width: int = 60) -> None:
+    from openpyxl.utils import get_column_letter
+
     for col in ws.columns:
         max_len = 0
         col_letter = get_column_letter(col[0].column)
@@ -416,7 +631,91 @@ def autosize(ws: Worksheet, max_width: int = 60) -> None:
                 pass
         ws.column_dimensions[col_letter].width = min(max_width, max(10, max_len + 2))
 
-def write_excel_report(
+def write_excel_xlsxwriter(
+    xlsx_path: Path,
+    overview_rows: List[Tuple[str, Any]],
+    issues: List[Dict[str, Any]],
+    dup_groups: List[Dict[str, Any]],
+    playlist_rows: List[Dict[str, Any]],
+    orphan_rows: List[Dict[str, Any]],
+    broken_rows: List[Dict[str, Any]],
+    missing_file_rows: List[Any],
+    artwork_rows: List[Any],
+    mik_rows: List[Tuple[Any, ...]],
+) -> None:
+    """
+    constant_memory mode streams each row to disk as it is written, so the
+    workbook stays O(1) in RAM no matter how large the extracts get.
+    Column widths are tracked while streaming since the rows are gone by
+    the time the sheet is finalised.
+    """
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(str(xlsx_path), {"constant_memory": True})
+    try:
+        def set_widths(ws, widths: List[int], max_width: int = 60) -> None:
+            for j, wdt in enumerate(widths):
+                ws.set_column(j, j, min(max_width, max(10, wdt + 2)))
+
+        def add_sheet(name: str, headers: List[str], rows: List[Any]):
+            ws = wb.add_worksheet(name[:31])
+            widths = [len(h) for h in headers]
+            ws.write_row(0, 0, headers)
+            for i, r in enumerate(rows, start=1):
+                vals = [r.get(h, "") for h in headers] if isinstance(r, dict) else list(r)
+                for j, v in enumerate(vals):
+                    n = len(str(v))
+                    if n > widths[j]:
+                        widths[j] = n
+                ws.write_row(i, 0, vals)
+            set_widths(ws, widths)
+
+        ws = wb.add_worksheet("Overview")
+        widths = [0, 0]
+        for i, (k, v) in enumerate(overview_rows):
+            for j, cell in enumerate((k, v)):
+                n = len(str(cell))
+                if n > widths[j]:
+                    widths[j] = n
+            ws.write_row(i, 0, [k, v])
+        set_widths(ws, widths)
+
+        add_sheet("Quality Issues",
+                  ["Issue", "TrackID", "Artist", "Title", "Genre", "Year", "BPM", "Key", "BitRate", "SampleRate", "Kind", "Location"],
+                  issues)
+
+        add_sheet("Duplicates",
+                  ["DuplicateType", "GroupKey", "Count", "TrackIDs", "Artists", "Titles", "Locations"],
+                  dup_groups)
+
+        add_sheet("Playlists",
+                  ["PlaylistPath", "NodeType", "Entries", "ActualTrackKeys"],
+                  playlist_rows)
+
+        add_sheet("Orphans",
+                  ["TrackKey", "TrackID", "Artist", "Title", "Location"],
+                  orphan_rows)
+
+        add_sheet("Broken Playlist Refs",
+                  ["PlaylistPath", "MissingTrackKey"],
+                  broken_rows)
+
+        add_sheet("Missing Files",
+                  ["TrackID", "Artist", "Title", "Location", "Exists", "RelinkSuggestion"],
+                  missing_file_rows)
+
+        add_sheet("Artwork Scan",
+                  ["TrackID", "Artist", "Title", "Location", "HasArt", "ArtBytes", "ArtSha1", "IsPlaceholder"],
+                  artwork_rows)
+
+        add_sheet("MIK Compare",
+                  ["Status", "TrackID", "Artist", "Title", "RB_Path", "MIK_Path", "RB_BPM", "MIK_BPM", "RB_Key", "MIK_Key"],
+                  mik_rows)
+    finally:
+        wb.close()
+
+
+def write_excel_openpyxl(
     xlsx_path: Path,
     overview_rows: List[Tuple[str, Any]],
     issues: List[Dict[str, Any]],
@@ -424,20 +723,22 @@ def write_excel_report(
     playlist_rows: List[Dict[str, Any]],
     orphan_rows: List[Dict[str, Any]],
     broken_rows: List[Dict[str, Any]],
-    missing_file_rows: List[Dict[str, Any]],
-    artwork_rows: List[Dict[str, Any]],
-    mik_rows: List[Dict[str, Any]],
+    missing_file_rows: List[Tuple[Any, ...]],
+    artwork_rows: List[Tuple[Any, ...]],
+    mik_rows: List[Tuple[Any, ...]],
 ) -> None:
     if not OPENPYXL_OK:
         return
+    import openpyxl
+
     wb = openpyxl.Workbook()
     wb.remove(wb.active)
 
-    def add_sheet(name: str, headers: List[str], rows: List[Dict[str, Any]]):
+    def add_sheet(name: str, headers: List[str], rows: List[Any]):
         ws = wb.create_sheet(title=name[:31])
         ws.append(headers)
         for r in rows:
-            ws.append([r.get(h, "") for h in headers])
+            ws.append([r.get(h, "") for h in headers] if isinstance(r, dict) else list(r))
         autosize(ws)
 
     # Overview
@@ -482,6 +783,17 @@ def write_excel_report(
     wb.save(str(xlsx_path))
 
 
+def write_excel_report(*args: Any) -> None:
+    if XLSXWRITER_OK:
+        try:
+            write_excel_xlsxwriter(*args)
+            return
+        except Exception as e:
+            print(f"[WARN] xlsxwriter output failed ({e}), falling back to openpyxl.")
+    if OPENPYXL_OK:
+        write_excel_openpyxl(*args)
+
+
 # ---------------------------
 # Main analysis
 # ---------------------------
@@ -497,18 +809,29 @@ def analyse(
     do_missing_files: bool = True,
 ) -> None:
     outdir = ensure_outdir(outdir)
+    # Report timestamp, fixed at run start; every output filename reuses
+    # this one string.
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     settings = load_settings(settings_path)
-    placeholder_fp = None
+    # Placeholder fingerprints, cheapest-first: length, then a 32-byte
+    # prefix, then the full digest. Most artwork fails the length check
+    # so the comparison rarely gets past the first step.
+    placeholder_len = None
+    placeholder_prefix = None
     placeholder_sha1 = None
     try:
         ph = settings.get("discogs", {}).get("placeholder_image", "")
         if ph:
             placeholder_fp = Path(ph)
             if placeholder_fp.exists():
-                placeholder_sha1 = sha1_file(placeholder_fp)
+                ph_bytes = placeholder_fp.read_bytes()
+                placeholder_len = len(ph_bytes)
+                placeholder_prefix = ph_bytes[:32]
+                placeholder_sha1 = sha1_bytes(ph_bytes)
     except Exception:
-        placeholder_fp = None
+        placeholder_len = None
+        placeholder_prefix = None
         placeholder_sha1 = None
 
     tracks: List[Track] = []
@@ -693,64 +1016,93 @@ def analyse(
                 "Location": t.location_path,
             })
 
-    # Missing file checks (+ smart relink)
-    missing_file_rows: List[Dict[str, Any]] = []
+    # Missing file checks (+ smart relink) and artwork scan, fused into a
+    # single pass so each track is stat'ed once and its attributes stay
+    # cache-hot across both stages. Column-oriented accumulation (SoA):
+    # one list per output column, zipped into rows at write time.
+    missing_file_rows: List[Tuple[Any, ...]] = []
     relink_index: Dict[str, str] = {}
-    if do_missing_files:
-        if music_root and music_root.exists():
-            print(f"[INFO] Building relink index under: {music_root}")
-            # filename -> full path (first match)
-            for fp in music_root.rglob("*"):
-                if fp.is_file():
-                    relink_index.setdefault(fp.name.lower(), str(fp))
-        else:
-            music_root = None
-
-        print("[INFO] Checking file existence...")
-        for t in tracks:
-            p = Path(t.location_path) if t.location_path else None
-            exists = bool(p and p.exists())
-            relink = ""
-            if not exists and relink_index and p:
-                relink = relink_index.get(p.name.lower(), "")
-            missing_file_rows.append({
-                "TrackID": t.track_id,
-                "Artist": t.artist,
-                "Title": t.name,
-                "Location": t.location_path,
-                "Exists": "Y" if exists else "N",
-                "RelinkSuggestion": relink,
-            })
-
-    # Artwork scan
-    artwork_rows: List[Dict[str, Any]] = []
+    mf_exists_col: List[str] = []
+    artwork_rows: List[Tuple[Any, ...]] = []
     no_art_paths: List[str] = []
     placeholder_paths: List[str] = []
-    if do_artwork:
-        if not MUTAGEN_OK:
-            print("[WARN] mutagen not installed, skipping embedded artwork scan.")
-        else:
+    scan_art = do_artwork and MUTAGEN_OK
+    if do_artwork and not MUTAGEN_OK:
+        print("[WARN] mutagen not installed, skipping embedded artwork scan.")
+    if do_missing_files or scan_art:
+        if do_missing_files:
+            if music_root and music_root.exists():
+                print(f"[INFO] Building relink index under: {music_root}")
+                # filename -> full path (first match)
+                for name, full in iter_files(str(music_root)):
+                    relink_index.setdefault(name, full)
+            else:
+                music_root = None
+            print("[INFO] Checking file existence...")
+        if scan_art:
             print("[INFO] Scanning embedded artwork (can take time on large libraries)...")
-            for t in tracks:
-                p = Path(t.location_path) if t.location_path else None
-                if not p or not p.exists():
-                    continue
-                has_art, art_sha1, art_len = extract_embedded_art_sha1(p)
-                is_placeholder = (placeholder_sha1 is not None and art_sha1 == placeholder_sha1) if art_sha1 else False
-                artwork_rows.append({
-                    "TrackID": t.track_id,
-                    "Artist": t.artist,
-                    "Title": t.name,
-                    "Location": t.location_path,
-                    "HasArt": "Y" if has_art else "N",
-                    "ArtBytes": art_len or "",
-                    "ArtSha1": art_sha1 or "",
-                    "IsPlaceholder": "Y" if is_placeholder else "N",
-                })
+
+        mf_trackid_col: List[str] = []
+        mf_artist_col: List[str] = []
+        mf_title_col: List[str] = []
+        mf_loc_col: List[str] = []
+        mf_relink_col: List[str] = []
+        art_trackid_col: List[str] = []
+        art_artist_col: List[str] = []
+        art_title_col: List[str] = []
+        art_loc_col: List[str] = []
+        art_hasart_col: List[str] = []
+        art_bytes_col: List[Any] = []
+        art_sha1_col: List[str] = []
+        art_ph_col: List[str] = []
+        # os.path on plain strings here; building a Path per track is
+        # measurable on six-figure collections
+        path_exists = os.path.exists
+        basename = os.path.basename
+        for t in tracks:
+            loc = t.location_path
+            exists = bool(loc) and path_exists(loc)
+            if do_missing_files:
+                relink = ""
+                if not exists and relink_index and loc:
+                    relink = relink_index.get(basename(loc).lower(), "")
+                mf_trackid_col.append(t.track_id)
+                mf_artist_col.append(t.artist)
+                mf_title_col.append(t.name)
+                mf_loc_col.append(loc)
+                mf_exists_col.append("Y" if exists else "N")
+                mf_relink_col.append(relink)
+            if scan_art and exists:
+                art = extract_embedded_art(loc)
+                has_art = art is not None and len(art) > 0
+                art_len = len(art) if has_art else None
+                art_sha1 = sha1_bytes(art) if has_art else None
+                is_placeholder = bool(
+                    has_art
+                    and placeholder_len is not None
+                    and art_len == placeholder_len
+                    and art[:32] == placeholder_prefix
+                    and art_sha1 == placeholder_sha1
+                )
+                art_trackid_col.append(t.track_id)
+                art_artist_col.append(t.artist)
+                art_title_col.append(t.name)
+                art_loc_col.append(loc)
+                art_hasart_col.append("Y" if has_art else "N")
+                art_bytes_col.append(art_len or "")
+                art_sha1_col.append(art_sha1 or "")
+                art_ph_col.append("Y" if is_placeholder else "N")
                 if not has_art:
-                    no_art_paths.append(t.location_path)
+                    no_art_paths.append(loc)
                 elif is_placeholder:
-                    placeholder_paths.append(t.location_path)
+                    placeholder_paths.append(loc)
+        if do_missing_files:
+            missing_file_rows = list(zip(mf_trackid_col, mf_artist_col, mf_title_col,
+                                         mf_loc_col, mf_exists_col, mf_relink_col))
+        if scan_art:
+            artwork_rows = list(zip(art_trackid_col, art_artist_col, art_title_col,
+                                    art_loc_col, art_hasart_col, art_bytes_col,
+                                    art_sha1_col, art_ph_col))
 
     # Write issue playlists (.m3u8)
     def write_m3u8(name: str, paths: List[str]):
@@ -768,54 +1120,12 @@ def analyse(
     write_m3u8("placeholder_artwork", placeholder_paths)
 
     # MIK compare
-    mik_rows: List[Dict[str, Any]] = []
+    mik_rows: List[Tuple[Any, ...]] = []
     if mik_csv and mik_csv.exists():
         print(f"[INFO] Loading MIK CSV: {mik_csv}")
-        mik = read_mik_csv(mik_csv)
-        rb_paths = { (t.location_path or "").lower(): t for t in tracks if t.location_path }
-        # missing in MIK
-        for pth, t in rb_paths.items():
-            if pth not in mik:
-                mik_rows.append({
-                    "Status": "Missing in MIK",
-                    "TrackID": t.track_id, "Artist": t.artist, "Title": t.name,
-                    "RB_Path": t.location_path, "MIK_Path": "",
-                    "RB_BPM": t.bpm, "MIK_BPM": "",
-                    "RB_Key": t.key, "MIK_Key": "",
-                })
-        # missing in RB
-        for pth, m in mik.items():
-            if pth not in rb_paths:
-                mik_rows.append({
-                    "Status": "Missing in Rekordbox",
-                    "TrackID": "", "Artist": "", "Title": "",
-                    "RB_Path": "", "MIK_Path": m.get("path",""),
-                    "RB_BPM": "", "MIK_BPM": m.get("bpm",""),
-                    "RB_Key": "", "MIK_Key": m.get("key",""),
-                })
-        # diffs
-        for pth, t in rb_paths.items():
-            m = mik.get(pth)
-            if not m:
-                continue
-            mbpm = safe_float(m.get("bpm", 0.0), 0.0)
-            mkey = (m.get("key", "") or "").strip()
-            status = []
-            if mbpm and t.bpm and abs(mbpm - t.bpm) >= 0.75:
-                status.append("BPM diff")
-            if mkey and t.key and norm_key(mkey) != norm_key(t.key):
-                status.append("Key diff")
-            if status:
-                mik_rows.append({
-                    "Status": ", ".join(status),
-                    "TrackID": t.track_id, "Artist": t.artist, "Title": t.name,
-                    "RB_Path": t.location_path, "MIK_Path": m.get("path",""),
-                    "RB_BPM": t.bpm, "MIK_BPM": mbpm,
-                    "RB_Key": t.key, "MIK_Key": mkey,
-                })
+        mik_rows = compare_mik(tracks, mik_csv)
 
     # Write outputs
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     summary_txt = outdir / f"rekordbox_report_{ts}.txt"
     xlsx_path = outdir / f"rekordbox_report_{ts}.xlsx"
 
@@ -833,7 +1143,7 @@ def analyse(
         f.write(f"Orphans: {len(orphan_rows)}\n")
         f.write(f"Broken playlist refs: {len(broken_rows)}\n")
         if do_missing_files:
-            missing = sum(1 for r in missing_file_rows if r.get("Exists") == "N")
+            missing = mf_exists_col.count("N")
             f.write(f"Missing files: {missing}\n")
         if do_artwork and MUTAGEN_OK:
             f.write(f"Artwork scanned rows: {len(artwork_rows)}\n")
@@ -843,7 +1153,7 @@ def analyse(
             f.write(f"MIK compare rows: {len(mik_rows)}\n")
 
     # Excel
-    if OPENPYXL_OK:
+    if XLSXWRITER_OK or OPENPYXL_OK:
         print(f"[INFO] Writing Excel: {xlsx_path}")
         write_excel_report(
             xlsx_path,
@@ -858,7 +1168,7 @@ def analyse(
             mik_rows,
         )
     else:
-        print("[WARN] openpyxl not installed, skipping Excel output.")
+        print("[WARN] Neither xlsxwriter nor openpyxl installed, skipping Excel output.")
 
     # Also dump CSVs for easy grepping
     print("[INFO] Writing CSV extracts...")
@@ -892,13 +1202,20 @@ def analyse(
 
     print("\n[OK] Done.")
     print(f"Summary: {summary_txt}")
-    if OPENPYXL_OK:
+    if XLSXWRITER_OK or OPENPYXL_OK:
         print(f"Excel:   {xlsx_path}")
     print(f"Outdir:  {outdir}")
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(description="Baseline Rekordbox XML analyser")
+    p = argparse.ArgumentParser(
+        description="Baseline Rekordbox XML analyser",
+        epilog=(
+            "Tip: this is an allocation-heavy batch job; on big libraries it "
+            "runs noticeably faster under an alternative allocator, e.g. "
+            "LD_PRELOAD=/usr/lib/libmimalloc.so.2 python3 rekordbox_analyse.py ..."
+        ),
+    )
     p.add_argument("xml", help="Path to Rekordbox exported XML (Collection.xml)")
     p.add_argument("--outdir", default="", help="Output folder for reports (default: ./baseline_work/rekordbox_reports)")
     p.add_argument("--music-root", default="", help="Optional folder root to index for relink suggestions")
@@ -939,4 +1256,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Standalone runs are single-threaded; a longer switch interval cuts
+    # GIL bookkeeping in the row-emission loops. Not set when imported by
+    # the GUI, which runs this alongside its own threads.
+    sys.setswitchinterval(1.0)
     main()
@@ -12,14 +12,14 @@ Highlights:
 """
 
 import sys
+import functools
+import hashlib
 import threading
 import queue
-import traceback
 import builtins
 import re
 import os
 import json
-from dataclasses import dataclass
 from pathlib import Path
 import importlib.util
 from datetime import datetime
@@ -28,11 +28,28 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from tkinter import font as tkfont
 
+@functools.cache
+def _pil():
+    """Pillow on first use; (Image, ImageTk), or (None, None) if missing."""
+    try:
+        from PIL import Image, ImageTk
+        return Image, ImageTk
+    except Exception:
+        return None, None
+
+
 try:
-    from PIL import Image, ImageTk
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
 except Exception:
-    Image = None
-    ImageTk = None
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
 
 
 ROOT = Path(__file__).resolve().parent
@@ -57,6 +74,12 @@ LEGACY_SETTINGS_PATHS = [
 
 LOGS_ROOT = Path.home() / "Documents" / "Baseline" / "Logs"
 
+DEFAULT_DISCOGS_USER_AGENT = "Baseline (Music library maintenance for DJs)"
+
+# Matches "(y/n)"-style markers in tool prompts; compiled once since
+# batch runs can raise hundreds of prompts.
+_YN_RE = re.compile(r"\b\(?\s*y\s*/\s*n\s*\)?\b")
+
 UI_COLORS = {
     "bg": "#F2EEE6",
     "panel": "#FBF8F2",
@@ -69,11 +92,43 @@ UI_COLORS = {
 }
 
 
+def _tcl_quote(v) -> str:
+    """Quote a value (or nested tuple, e.g. a font spec) as one Tcl word."""
+    if isinstance(v, (tuple, list)):
+        return "{" + " ".join(_tcl_quote(x) for x in v) + "}"
+    s = str(v)
+    if not s or any(c in s for c in ' \t\n{}"\\[]$;'):
+        return "{" + s + "}"
+    return s
+
+
+# Font families per Tcl interpreter; querying them is slow enough to show
+# up in GUI launch time, so the result is shared across App instances.
+_FAMILIES_CACHE: dict[int, frozenset[str]] = {}
+
+
 def _safe_mkdir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+# Loaded tool modules keyed by script path and invalidated when the file
+# changes on disk, so a second click on Run skips the whole exec/import
+# phase (the tools import mutagen/requests/PIL at top level).
+_MODULE_CACHE: dict[str, tuple[int, object]] = {}
+
+
 def load_module(module_path: Path, module_name: str):
+    key = str(module_path)
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    cached = _MODULE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        mod = cached[1]
+        sys.modules[module_name] = mod
+        return mod
+
     spec = importlib.util.spec_from_file_location(module_name, str(module_path))
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Could not load module: {module_path}")
@@ -88,39 +143,57 @@ def load_module(module_path: Path, module_name: str):
         else:
             sys.modules[module_name] = previous
         raise
+    _MODULE_CACHE[key] = (mtime_ns, mod)
     return mod
 
 
 class Logger:
-    def __init__(self, q: "queue.Queue[str]"):
+    # write() is the hottest call in the app; a single print() from a
+    # worker script arrives as two writes (payload then newline), so
+    # fragments are buffered and queued as one chunk per line, or per
+    # 4 KiB for scripts that stream without newlines.
+    def __init__(self, q: "queue.SimpleQueue[str]", notify=None):
         self.q = q
+        self.notify = notify
+        self._put = q.put
+        self._buf: list[str] = []
+        self._size = 0
 
     def write(self, s: str):
-        if s:
-            self.q.put(s)
+        if not s:
+            return
+        self._buf.append(s)
+        self._size += len(s)
+        if "\n" in s or "\r" in s or self._size > 4096:
+            self.flush()
 
     def flush(self):
-        return
-
-
-@dataclass
-class InputRequest:
-    prompt: str
-    event: threading.Event
-    result: str = ""
-
+        if self._buf:
+            self._put("".join(self._buf))
+            self._buf.clear()
+            self._size = 0
+            if self.notify:
+                self.notify()
 
 
 class Settings:
     def __init__(self):
+        self._last_saved: bytes | None = None
+        self._save_lock = threading.Lock()
         _safe_mkdir(SETTINGS_DIR)
-        discogs_placeholder = str((ROOT / "Discogs" / "placeholder.jpg").resolve()) if (ROOT / "Discogs" / "placeholder.jpg").exists() else ""
-        discogs_fallback = str((ROOT / "Discogs" / "white_label.jpg").resolve()) if (ROOT / "Discogs" / "white_label.jpg").exists() else ""
+        # One directory listing instead of a stat per candidate image.
+        try:
+            with os.scandir(ROOT / "Discogs") as it:
+                discogs_images = {e.name: e.path for e in it}
+        except OSError:
+            discogs_images = {}
+        discogs_placeholder = str(Path(discogs_images["placeholder.jpg"]).resolve()) if "placeholder.jpg" in discogs_images else ""
+        discogs_fallback = str(Path(discogs_images["white_label.jpg"]).resolve()) if "white_label.jpg" in discogs_images else ""
         self.data = {
             "discogs": {
                 "consumer_key": "",
                 "consumer_secret": "",
-                "user_agent": "Baseline (Music library maintenance for DJs)",
+                "user_agent": DEFAULT_DISCOGS_USER_AGENT,
                 "min_art_size": 500,
                 "auto_accept_resize_small_art": False,
                 "placeholder_image": discogs_placeholder,
@@ -136,7 +209,7 @@ class Settings:
     @staticmethod
     def _load_json_file(path: Path) -> dict:
         try:
-            loaded = json.loads(path.read_text(encoding="utf-8"))
+            loaded = _json_loads(path.read_bytes())
             return loaded if isinstance(loaded, dict) else {}
         except Exception:
             return {}
@@ -171,8 +244,23 @@ class Settings:
                 self.data[k] = v
 
     def save(self):
-        _safe_mkdir(SETTINGS_DIR)
-        SETTINGS_PATH.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+        # The lock keeps background threads (e.g. the Discogs test) from
+        # racing a UI-triggered save on the same temp file.
+        with self._save_lock:
+            payload = _json_dumps(self.data)
+            if payload == self._last_saved:
+                return
+            _safe_mkdir(SETTINGS_DIR)
+            # Write-then-rename keeps the settings file whole if the app
+            # dies mid-save (and gives AV scanners one file event, not
+            # two); the fsync makes the rename land on real bytes.
+            tmp = SETTINGS_PATH.with_suffix(".json.tmp")
+            with tmp.open("wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, SETTINGS_PATH)
+            self._last_saved = payload
 
 
 class App(tk.Tk):
@@ -180,6 +268,7 @@ class App(tk.Tk):
         super().__init__()
         self.settings = Settings()
 
+        self._families = self._font_families()
         self._body_font = self._pick_font(("Bahnschrift", "Segoe UI", "Calibri", "Arial"))
         self._title_font = self._pick_font(("Bahnschrift SemiBold", "Segoe UI Semibold", "Trebuchet MS", "Arial"))
         self._mono_font = self._pick_font(("Cascadia Mono", "Consolas", "Courier New", "Courier"))
@@ -189,8 +278,9 @@ class App(tk.Tk):
         self.geometry("1220x860")
         self.minsize(1040, 720)
 
-        self.log_q: "queue.Queue[str]" = queue.Queue()
-        self.input_request_q: "queue.Queue[InputRequest]" = queue.Queue()
+        # SimpleQueue is reentrant and implemented in C, so bursty tool
+        # output costs one lock-free put per line instead of a mutex cycle.
+        self.log_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self.worker: threading.Thread | None = None
 
         self.run_id = None
@@ -199,27 +289,53 @@ class App(tk.Tk):
         self.run_summary_fp = None
 
         self._preview_photo = None
-        self._preview_signature: tuple[int, bytes, bytes] | None = None
+        self._preview_signature: bytes | None = None
         self._preview_caption = tk.StringVar(value="No preview yet")
         self._interactive_controls: list[tk.Misc] = []
+        self._controls_enabled = True
         self._mik_db_cache: Path | None = None
         self._mik_db_cache_ready = False
+        self._http = None
+        self._save_debounce_id: str | None = None
+        # Resolved once; _save_settings resets it after writing the
+        # canonical file, so no per-click stat cascade is needed.
+        self._effective_settings_path = self._resolve_settings_path()
+        # Tk Text slows down badly once it holds very long documents, so
+        # the run log keeps only the newest lines on screen; the full
+        # output still goes to the per-run log file.
+        self._log_max_lines = 5000
+
+        # Log drains are event-driven: workers fire <<LogAvailable>> after
+        # putting lines, coalesced by _log_pending; the slow _pump_logs
+        # tick stays as a safety net only.
+        self._log_pending = False
+        self.bind("<<LogAvailable>>", self._on_log_available)
 
         self._build_ui()
         self._pump_logs()
-        self._pump_input_requests()
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def _pick_font(self, candidates: tuple[str, ...]) -> str:
+        # Warm Pillow off the UI thread once the window is up, so the
+        # first artwork preview does not pay the import.
+        self.after(300, lambda: threading.Thread(target=_pil, daemon=True).start())
+
+    def _font_families(self) -> frozenset[str]:
         try:
-            families = {str(f) for f in self.tk.call("font", "families")}
+            key = self.tk.interpaddr()
         except Exception:
-            families = set()
-        for name in candidates:
-            if name in families:
-                return name
-        return "TkDefaultFont"
+            key = 0
+        families = _FAMILIES_CACHE.get(key)
+        if families is None:
+            try:
+                families = frozenset(map(str, self.tk.call("font", "families")))
+            except Exception:
+                families = frozenset()
+            _FAMILIES_CACHE[key] = families
+        return families
+
+    def _pick_font(self, candidates: tuple[str, ...]) -> str:
+        return next((n for n in candidates if n in self._families), "TkDefaultFont")
 
     def _configure_theme(self):
         self.option_add("*tearOff", False)
@@ -230,41 +346,75 @@ class App(tk.Tk):
             pass
 
         self.configure(bg=UI_COLORS["bg"])
-        style.configure(".", font=(self._body_font, 10))
-        style.configure("TFrame", background=UI_COLORS["bg"])
-        style.configure("Header.TFrame", background=UI_COLORS["bg"])
-        style.configure("TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"], font=(self._body_font, 10))
-        style.configure("Title.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"], font=(self._title_font, 24, "bold"))
-        style.configure("Subtitle.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["muted"], font=(self._body_font, 10))
-        style.configure("Status.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["accent"], font=(self._body_font, 10, "bold"))
-
-        style.configure("TNotebook", background=UI_COLORS["bg"], borderwidth=0)
-        style.configure("TNotebook.Tab", padding=(14, 8), font=(self._body_font, 10, "bold"))
-        style.map(
+        body = (self._body_font, 10)
+        body_bold = (self._body_font, 10, "bold")
+
+        # All style options are applied in one Tcl eval instead of ~18
+        # separate configure/map round-trips through the bridge.
+        script: list[str] = []
+
+        def conf(name: str, **opts):
+            words = " ".join(f"-{k} {_tcl_quote(v)}" for k, v in opts.items())
+            script.append(f"ttk::style configure {name} {words}")
+
+        def state_map(name: str, **opts):
+            words = []
+            for k, pairs in opts.items():
+                flat = " ".join(f"{_tcl_quote(st)} {_tcl_quote(v)}" for st, v in pairs)
+                words.append(f"-{k} {{{flat}}}")
+            script.append(f"ttk::style map {name} " + " ".join(words))
+
+        conf(".", font=body)
+        conf("TFrame", background=UI_COLORS["bg"])
+        conf("Header.TFrame", background=UI_COLORS["bg"])
+        conf("TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"], font=body)
+        conf("Title.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"], font=(self._title_font, 24, "bold"))
+        conf("Subtitle.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["muted"], font=body)
+        conf("Status.TLabel", background=UI_COLORS["bg"], foreground=UI_COLORS["accent"], font=body_bold)
+
+        conf("TNotebook", background=UI_COLORS["bg"], borderwidth=0)
+        conf("TNotebook.Tab", padding=(14, 8), font=body_bold)
+        state_map(
             "TNotebook.Tab",
             background=[("selected", UI_COLORS["panel"]), ("!selected", "#E5DED1")],
             foreground=[("selected", UI_COLORS["accent"]), ("!selected", UI_COLORS["ink"])],
         )
 
-        style.configure("TLabelframe", background=UI_COLORS["panel"], borderwidth=1, relief="solid")
-        style.configure("TLabelframe.Label", background=UI_COLORS["panel"], foreground=UI_COLORS["ink"], font=(self._body_font, 10, "bold"))
-        style.configure("TCheckbutton", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"])
-        style.map("TCheckbutton", foreground=[("disabled", UI_COLORS["muted"])])
-        style.configure("TEntry", fieldbackground=UI_COLORS["field"])
-        style.configure("TButton", padding=(10, 6), font=(self._body_font, 10))
-        style.configure("Primary.TButton", padding=(12, 7), font=(self._body_font, 10, "bold"), foreground="white", background=UI_COLORS["accent"], borderwidth=0)
-        style.map(
+        conf("TLabelframe", background=UI_COLORS["panel"], borderwidth=1, relief="solid")
+        conf("TLabelframe.Label", background=UI_COLORS["panel"], foreground=UI_COLORS["ink"], font=body_bold)
+        conf("TCheckbutton", background=UI_COLORS["bg"], foreground=UI_COLORS["ink"])
+        state_map("TCheckbutton", foreground=[("disabled", UI_COLORS["muted"])])
+        conf("TEntry", fieldbackground=UI_COLORS["field"])
+        conf("TButton", padding=(10, 6), font=body)
+        conf("Primary.TButton", padding=(12, 7), font=body_bold, foreground="white", background=UI_COLORS["accent"], borderwidth=0)
+        state_map(
             "Primary.TButton",
             background=[("active", UI_COLORS["accent_active"]), ("!disabled", UI_COLORS["accent"]), ("disabled", "#AEB6BE")],
             foreground=[("disabled", "#F8F9FA"), ("!disabled", "white")],
         )
 
+        self.tk.eval("\n".join(script))
+
     def _on_close(self):
         if self.worker and self.worker.is_alive():
             messagebox.showwarning("Baseline is busy", "A task is running. Please wait for it to finish before closing.")
             return
+        self._flush_settings_save()
         self.destroy()
 
+    def _schedule_settings_save(self):
+        # Coalesce bursts of settings changes into one disk write; 400ms
+        # after the last change (or on close) the save actually runs.
+        if self._save_debounce_id is not None:
+            self.after_cancel(self._save_debounce_id)
+        self._save_debounce_id = self.after(400, self._flush_settings_save)
+
+    def _flush_settings_save(self):
+        if self._save_debounce_id is not None:
+            self.after_cancel(self._save_debounce_id)
+            self._save_debounce_id = None
+        self.settings.save()
+
     def _build_ui(self):
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
@@ -287,6 +437,7 @@ class App(tk.Tk):
 
 
         self.nb = ttk.Notebook(self)
+        self._register_control(self.nb)
         self.nb.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
         self.tab_discogs = ttk.Frame(self.nb, padding=10)
@@ -301,11 +452,18 @@ class App(tk.Tk):
         self.nb.add(self.tab_rekordbox, text="Rekordbox XML")
         self.nb.add(self.tab_settings, text="Settings")
 
-        self._build_discogs_tab()
-        self._build_filename_tab()
-        self._build_mik_tab()
-        self._build_rekordbox_tab()
-        self._build_settings_tab()
+        # Build only the tab that is visible at startup; the rest are
+        # built on first view, which keeps cold start proportional to one
+        # tab's widget count instead of all five.
+        self._tab_builders = {
+            str(self.tab_discogs): self._build_discogs_tab,
+            str(self.tab_filename): self._build_filename_tab,
+            str(self.tab_mik): self._build_mik_tab,
+            str(self.tab_rekordbox): self._build_rekordbox_tab,
+            str(self.tab_settings): self._build_settings_tab,
+        }
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._build_selected_tab()
 
         log_frame = ttk.LabelFrame(self, text="Run Log", padding=10)
         log_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
@@ -327,6 +485,8 @@ class App(tk.Tk):
             padx=8,
             pady=8,
             font=(self._mono_font, 10),
+            undo=False,
+            autoseparators=False,
         )
         self.txt_log.grid(row=0, column=0, sticky="nsew")
         yscroll = ttk.Scrollbar(log_frame, orient="vertical", command=self.txt_log.yview)
@@ -337,52 +497,83 @@ class App(tk.Tk):
         btns.grid(row=3, column=0, sticky="ew")
         btns.columnconfigure(0, weight=1)
 
-        self.btn_open_last_run = ttk.Button(btns, text="Open Last Run Folder", command=self._open_last_run)
+        self.btn_open_last_run = self._mk_button(btns, text="Open Last Run Folder", command=self._open_last_run)
         self.btn_open_last_run.grid(row=0, column=1, sticky="e")
-        self.btn_clear_log = ttk.Button(btns, text="Clear Log", command=self._clear_log)
+        self.btn_clear_log = self._mk_button(btns, text="Clear Log", command=self._clear_log)
         self.btn_clear_log.grid(row=0, column=2, sticky="e", padx=(8, 0))
         self.btn_quit = ttk.Button(btns, text="Quit", command=self._on_close)
         self.btn_quit.grid(row=0, column=3, sticky="e", padx=(8, 0))
 
-        self._interactive_controls = self._collect_interactive_controls()
+    # Interactive controls register themselves at creation via the _mk_*
+    # helpers, so no post-build walk over the widget tree is needed. The
+    # Quit button is deliberately created plain: it stays enabled.
+    @staticmethod
+    def _resolve_settings_path() -> Path | None:
+        if SETTINGS_PATH.exists():
+            return SETTINGS_PATH
+        for legacy_path in LEGACY_SETTINGS_PATHS:
+            if legacy_path.exists():
+                return legacy_path
+        return None
 
-    def _collect_interactive_controls(self) -> list[tk.Misc]:
-        controls: list[tk.Misc] = []
-        skip = {self.txt_log, self.busy_bar, self.btn_quit}
+    def _build_selected_tab(self):
+        try:
+            selected = self.nb.select()
+        except Exception:
+            return
+        builder = self._tab_builders.pop(selected, None)
+        if builder is not None:
+            builder()
+
+    def _on_tab_changed(self, _event=None):
+        self._build_selected_tab()
+
+    def _register_control(self, widget: tk.Misc) -> tk.Misc:
+        self._interactive_controls.append(widget)
+        # Tabs are built lazily, so a widget can appear mid-run; give it
+        # the current enabled/disabled state straight away.
+        if not self._controls_enabled:
+            try:
+                widget.configure(state="disabled")
+            except Exception:
+                pass
+        return widget
 
-        def walk(parent: tk.Misc):
-            for child in parent.winfo_children():
-                if child in skip:
-                    continue
-                if isinstance(child, (ttk.Button, ttk.Entry, ttk.Checkbutton, ttk.Notebook)):
-                    controls.append(child)
-                walk(child)
+    def _mk_button(self, parent: tk.Misc, **kw) -> ttk.Button:
+        return self._register_control(ttk.Button(parent, **kw))
+
+    def _mk_entry(self, parent: tk.Misc, **kw) -> ttk.Entry:
+        return self._register_control(ttk.Entry(parent, **kw))
 
-        walk(self)
-        return controls
+    def _mk_check(self, parent: tk.Misc, **kw) -> ttk.Checkbutton:
+        return self._register_control(ttk.Checkbutton(parent, **kw))
 
     def _set_controls_enabled(self, enabled: bool):
+        # _set_busy fires this on every start/stop; skip the N Tcl
+        # round-trips when the state is already what was asked for.
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
         state = "normal" if enabled else "disabled"
         for widget in self._interactive_controls:
             if not widget.winfo_exists():
                 continue
             try:
-                widget.configure(state=state)
+                if isinstance(widget, ttk.Notebook):
+                    widget.state(["!disabled" if enabled else "disabled"])
+                else:
+                    widget.configure(state=state)
             except Exception:
-                try:
-                    if isinstance(widget, ttk.Notebook):
-                        if enabled:
-                            widget.state(["!disabled"])
-                        else:
-                            widget.state(["disabled"])
-                except Exception:
-                    pass
+                pass
 
     def _clear_log(self):
         self.txt_log.delete("1.0", "end")
 
     def _append_log(self, s: str, flush: bool = True):
         self.txt_log.insert("end", s)
+        line_count = int(self.txt_log.index("end-1c").split(".")[0])
+        if line_count > self._log_max_lines:
+            self.txt_log.delete("1.0", f"{line_count - self._log_max_lines}.0")
         self.txt_log.see("end")
         if self.run_log_fp:
             try:
@@ -392,37 +583,50 @@ class App(tk.Tk):
             except Exception:
                 pass
 
-    def _pump_logs(self):
+    def _notify_log(self):
+        # Called from worker threads after a put. event_generate is safe
+        # to call across threads; _log_pending coalesces a burst of lines
+        # into a single virtual event.
+        if self._log_pending:
+            return
+        self._log_pending = True
+        try:
+            self.event_generate("<<LogAvailable>>", when="tail")
+        except Exception:
+            pass
+
+    def _on_log_available(self, _event=None):
+        self._drain_logs()
+
+    def _post_log(self, s: str):
+        self.log_q.put(s)
+        self._notify_log()
+
+    def _drain_logs(self):
+        self._log_pending = False
+        # Drain everything queued so a burst of tool output lands in a
+        # single Text insert instead of being rationed across ticks.
         chunks: list[str] = []
         try:
-            for _ in range(800):
+            while True:
                 chunks.append(self.log_q.get_nowait())
         except queue.Empty:
             pass
 
         if chunks:
             self._append_log("".join(chunks), flush=True)
-        self.after(70, self._pump_logs)
 
-    def _pump_input_requests(self):
-        try:
-            while True:
-                req = self.input_request_q.get_nowait()
-                req.result = self._handle_input_prompt(req.prompt)
-                req.event.set()
-        except queue.Empty:
-            pass
-        self.after(100, self._pump_input_requests)
+    def _pump_logs(self):
+        # Safety net for anything that slips past the virtual event, e.g.
+        # output produced while the window is being torn down.
+        self._drain_logs()
+        self.after(500, self._pump_logs)
 
     def _handle_input_prompt(self, prompt: str) -> str:
         prompt = (prompt or "").strip()
         prompt_lc = prompt.lower()
 
-        yn = False
-        if re.search(r"\b\(?\s*y\s*/\s*n\s*\)?\b", prompt_lc):
-            yn = True
-        if "please type y or n" in prompt_lc:
-            yn = True
+        yn = bool(_YN_RE.search(prompt_lc)) or "please type y or n" in prompt_lc
 
         if yn:
             msg = prompt if prompt else "Please choose Yes or No"
@@ -443,6 +647,7 @@ class App(tk.Tk):
     def _render_preview(self, caption: str, image_bytes: bytes | None):
         self._preview_caption.set(caption or "Artwork preview")
 
+        Image, ImageTk = _pil()
         if Image is None or ImageTk is None:
             self._preview_caption.set((caption or "Artwork preview") + "\n\nPillow not installed. Run: pip install pillow")
             self.lbl_preview_img.configure(image="")
@@ -456,16 +661,27 @@ class App(tk.Tk):
             return
 
         try:
-            if len(image_bytes) <= 64:
-                signature = (len(image_bytes), image_bytes, image_bytes)
+            # Compact dedupe signature: length plus head/tail, so multi-MB
+            # artwork is never hashed in full just to skip a redraw.
+            h = hashlib.blake2b(len(image_bytes).to_bytes(8, "little"), digest_size=16)
+            if len(image_bytes) <= 8192:
+                h.update(image_bytes)
             else:
-                signature = (len(image_bytes), image_bytes[:32], image_bytes[-32:])
+                h.update(image_bytes[:4096])
+                h.update(image_bytes[-4096:])
+            signature = h.digest()
             if signature == self._preview_signature:
                 return
 
             import io
             im = Image.open(io.BytesIO(image_bytes))
-            im.thumbnail((520, 560))
+            try:
+                # Lets libjpeg decode at a reduced DCT scale; no-op for
+                # non-JPEG formats.
+                im.draft("RGB", (520, 560))
+            except Exception:
+                pass
+            im.thumbnail((520, 560), Image.Resampling.BILINEAR)
             photo = ImageTk.PhotoImage(im)
             self.lbl_preview_img.configure(image=photo)
             self._preview_photo = photo
@@ -539,12 +755,17 @@ class App(tk.Tk):
         try:
             if sys.platform.startswith("win"):
                 os.startfile(str(path))  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
-                import subprocess
-                subprocess.call(["open", str(path)])
             else:
+                # Fire-and-forget: xdg-open in particular can block for
+                # seconds if waited on, which would stall the UI thread.
                 import subprocess
-                subprocess.call(["xdg-open", str(path)])
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen(
+                    [opener, str(path)],
+                    start_new_session=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -564,24 +785,26 @@ class App(tk.Tk):
             return
 
         self.after(0, lambda: self._set_busy(True, title))
-        self.log_q.put(f"\n== {title} ==\n")
-        self.log_q.put(f"Script: {script_path}\nArgs: {argv}\n\n")
+        self._post_log(f"\n== {title} ==\n")
+        self._post_log(f"Script: {script_path}\nArgs: {argv}\n\n")
 
         def bridged_input(prompt: str = "") -> str:
             if prompt:
-                self.log_q.put(prompt + ("\n" if not prompt.endswith("\n") else ""))
-            req = InputRequest(prompt=prompt, event=threading.Event())
-            self.input_request_q.put(req)
-            req.event.wait()
-            return req.result
+                self._post_log(prompt + ("\n" if not prompt.endswith("\n") else ""))
+            # Per-request reply channel: the worker blocks on reply.get()
+            # while the UI thread answers via the after() callback, no
+            # shared queue or polling delay involved.
+            reply: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+            self.after(0, lambda p=prompt: reply.put(self._handle_input_prompt(p)))
+            return reply.get()
 
         def worker():
             old_stdout, old_stderr = sys.stdout, sys.stderr
             old_argv = sys.argv
             old_input = builtins.input
 
-            sys.stdout = Logger(self.log_q)  # type: ignore[assignment]
-            sys.stderr = Logger(self.log_q)  # type: ignore[assignment]
+            sys.stdout = Logger(self.log_q, self._notify_log)  # type: ignore[assignment]
+            sys.stderr = Logger(self.log_q, self._notify_log)  # type: ignore[assignment]
             builtins.input = bridged_input
 
             ok = True
@@ -612,7 +835,7 @@ class App(tk.Tk):
                     mod.CoverPreview = CoverPreviewBridge  # type: ignore[attr-defined]
 
                 if not hasattr(mod, "main"):
-                    self.log_q.put("ERROR: Tool does not expose main().\n")
+                    self._post_log("ERROR: Tool does not expose main().\n")
                     ok = False
                 else:
                     sys.argv = [str(script_path)] + argv
@@ -636,12 +859,13 @@ class App(tk.Tk):
 
                     if rc != 0:
                         ok = False
-                    self.log_q.put(f"\nDone. Exit code: {rc}\n")
+                    self._post_log(f"\nDone. Exit code: {rc}\n")
 
             except Exception:
                 ok = False
-                self.log_q.put("\nERROR:\n")
-                self.log_q.put(traceback.format_exc() + "\n")
+                import traceback
+                self._post_log("\nERROR:\n")
+                self._post_log(traceback.format_exc() + "\n")
 
             finally:
                 try:
@@ -651,6 +875,11 @@ class App(tk.Tk):
 
                 builtins.input = old_input
                 sys.argv = old_argv
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                except Exception:
+                    pass
                 sys.stdout, sys.stderr = old_stdout, old_stderr
                 self.after(0, lambda: self._end_run(ok))
 
@@ -673,24 +902,24 @@ class App(tk.Tk):
 
         row = 0
         ttk.Label(f, text="Music folder:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.discogs_folder).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_discogs_folder).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.discogs_folder).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_discogs_folder).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
-        ttk.Checkbutton(f, text="Recursive", variable=self.discogs_recursive).grid(row=row, column=0, sticky="w", pady=(6,10))
+        self._mk_check(f, text="Recursive", variable=self.discogs_recursive).grid(row=row, column=0, sticky="w", pady=(6,10))
 
         opts = ttk.LabelFrame(f, text="Allow Baseline to update", padding=10)
         opts.grid(row=row, column=1, columnspan=2, sticky="ew", pady=(0,10))
-        ttk.Checkbutton(opts, text="Year", variable=self.discogs_do_year).grid(row=0, column=0, sticky="w")
-        ttk.Checkbutton(opts, text="Record label", variable=self.discogs_do_label).grid(row=0, column=1, sticky="w", padx=(16,0))
-        ttk.Checkbutton(opts, text="Artwork", variable=self.discogs_do_art).grid(row=0, column=2, sticky="w", padx=(16,0))
+        self._mk_check(opts, text="Year", variable=self.discogs_do_year).grid(row=0, column=0, sticky="w")
+        self._mk_check(opts, text="Record label", variable=self.discogs_do_label).grid(row=0, column=1, sticky="w", padx=(16,0))
+        self._mk_check(opts, text="Artwork", variable=self.discogs_do_art).grid(row=0, column=2, sticky="w", padx=(16,0))
 
         actions = ttk.Frame(f)
         actions.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(0,10))
         actions.columnconfigure(0, weight=1)
-        ttk.Button(actions, text="Run Discogs update", style="Primary.TButton", command=self._discogs_run_update).grid(row=0, column=0, sticky="w")
-        ttk.Button(actions, text="Run artwork scan", command=self._discogs_run_art_scan).grid(row=0, column=1, sticky="w", padx=(12,0))
-        ttk.Button(actions, text="Open Discogs Settings", command=lambda: self.nb.select(self.tab_settings)).grid(row=0, column=2, sticky="w", padx=(12,0))
+        self._mk_button(actions, text="Run Discogs update", style="Primary.TButton", command=self._discogs_run_update).grid(row=0, column=0, sticky="w")
+        self._mk_button(actions, text="Run artwork scan", command=self._discogs_run_art_scan).grid(row=0, column=1, sticky="w", padx=(12,0))
+        self._mk_button(actions, text="Open Discogs Settings", command=lambda: self.nb.select(self.tab_settings)).grid(row=0, column=2, sticky="w", padx=(12,0))
 
         # Preview panel
         split = ttk.Frame(f)
@@ -735,10 +964,11 @@ class App(tk.Tk):
             return
 
         self._clear_preview()
-        discogs_key = (self.settings.data.get("discogs", {}) or {}).get("consumer_key", "").strip()
-        discogs_secret = (self.settings.data.get("discogs", {}) or {}).get("consumer_secret", "").strip()
-        discogs_user_agent = (self.settings.data.get("discogs", {}) or {}).get("user_agent", "Baseline (Music library maintenance for DJs)").strip() or "Baseline (Music library maintenance for DJs)"
-        min_art = int((self.settings.data.get("discogs", {}) or {}).get("min_art_size", 500))
+        d = self.settings.data.get("discogs") or {}
+        discogs_key = (d.get("consumer_key") or "").strip()
+        discogs_secret = (d.get("consumer_secret") or "").strip()
+        discogs_user_agent = (d.get("user_agent") or "").strip() or DEFAULT_DISCOGS_USER_AGENT
+        min_art = int(d.get("min_art_size") or 500)
 
         # Provide credentials to Discogs scripts via environment variables
         if discogs_key and discogs_secret:
@@ -781,22 +1011,22 @@ class App(tk.Tk):
 
         row = 0
         ttk.Label(f, text="Music folder:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.fn_folder).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_fn_folder).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.fn_folder).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_fn_folder).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
-        ttk.Checkbutton(f, text="Recursive", variable=self.fn_recursive).grid(row=row, column=0, sticky="w", pady=(6,10))
+        self._mk_check(f, text="Recursive", variable=self.fn_recursive).grid(row=row, column=0, sticky="w", pady=(6,10))
 
         row += 1
         ttk.Label(f, text="Output CSV:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.fn_out_csv).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_fn_csv).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.fn_out_csv).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_fn_csv).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
-        ttk.Checkbutton(f, text="Also create review playlist (.m3u8)", variable=self.fn_out_m3u8).grid(row=row, column=0, sticky="w", pady=(6,10))
+        self._mk_check(f, text="Also create review playlist (.m3u8)", variable=self.fn_out_m3u8).grid(row=row, column=0, sticky="w", pady=(6,10))
 
         row += 1
-        ttk.Button(f, text="Run filename check (suggestions only)", style="Primary.TButton", command=self._run_filename_check).grid(row=row, column=0, sticky="w")
+        self._mk_button(f, text="Run filename check (suggestions only)", style="Primary.TButton", command=self._run_filename_check).grid(row=row, column=0, sticky="w")
 
         # Apply renames from an edited CSV (second step)
         row += 1
@@ -808,11 +1038,11 @@ class App(tk.Tk):
 
         row += 1
         ttk.Label(f, text="Edited CSV to apply:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.fn_apply_csv).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_fn_apply_csv).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.fn_apply_csv).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_fn_apply_csv).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
-        ttk.Checkbutton(
+        self._mk_check(
             f,
             text="Actually rename files (dangerous, double-check your CSV first)",
             variable=self.fn_do_rename
@@ -821,7 +1051,7 @@ class App(tk.Tk):
         # Optional: keep Mixed In Key DB in sync after renaming
         mik_db = self._detect_mik_db()
         if mik_db:
-            ttk.Checkbutton(
+            self._mk_check(
                 f,
                 text="Update Mixed In Key database paths after renaming",
                 variable=self.fn_update_mik_paths
@@ -835,7 +1065,7 @@ class App(tk.Tk):
             row += 1
 
         row += 1
-        ttk.Button(f, text="Apply renames from CSV", style="Primary.TButton", command=self._apply_filename_renames).grid(row=row, column=0, sticky="w")
+        self._mk_button(f, text="Apply renames from CSV", style="Primary.TButton", command=self._apply_filename_renames).grid(row=row, column=0, sticky="w")
 
 
 
@@ -879,6 +1109,7 @@ class App(tk.Tk):
             argv.append("--recursive")
         if self.fn_out_m3u8.get():
             argv.append("--m3u8")
+        argv.append(f"--workers={min(8, os.cpu_count() or 4)}")
 
         self._run_tool("Filename/filename_check.py", argv, "Filename check (suggestions only)")
 
@@ -913,28 +1144,28 @@ class App(tk.Tk):
 
         row = 0
         ttk.Label(f, text="MIK database:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.mik_db_path).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_mik_db).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.mik_db_path).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_mik_db).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         # attempt auto-detect
         autod = self._detect_mik_db()
         if autod and not self.mik_db_path.get():
             self.mik_db_path.set(str(autod))
             self.settings.data["mik"]["db_path"] = str(autod)
-            self.settings.save()
+            self._schedule_settings_save()
 
         row += 1
         ttk.Label(f, text="Report file:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.mik_report_path).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_mik_report).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.mik_report_path).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_mik_report).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
         opts = ttk.Frame(f)
         opts.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(6, 10))
-        ttk.Checkbutton(
+        self._mk_check(
             opts, text="Dry-run (no changes)", variable=self.mik_dry_run, command=self._sync_mik_mode
         ).grid(row=0, column=0, sticky="w")
-        ttk.Checkbutton(opts, text="Apply changes", variable=self.mik_apply, command=self._sync_mik_mode).grid(
+        self._mk_check(opts, text="Apply changes", variable=self.mik_apply, command=self._sync_mik_mode).grid(
             row=0, column=1, sticky="w", padx=(16, 0)
         )
 
@@ -943,13 +1174,13 @@ class App(tk.Tk):
         actions.grid(row=row, column=0, columnspan=3, sticky="ew")
         actions.columnconfigure(0, weight=1)
 
-        ttk.Button(actions, text="Prune missing files from DB", style="Primary.TButton", command=self._mik_prune_missing).grid(
+        self._mk_button(actions, text="Prune missing files from DB", style="Primary.TButton", command=self._mik_prune_missing).grid(
             row=0, column=0, sticky="ew", pady=4
         )
-        ttk.Button(actions, text="Sync tags from files into DB", command=self._mik_sync_tags).grid(
+        self._mk_button(actions, text="Sync tags from files into DB", command=self._mik_sync_tags).grid(
             row=1, column=0, sticky="ew", pady=4
         )
-        ttk.Button(actions, text="Sync artwork from files into DB", command=self._mik_sync_artwork).grid(
+        self._mk_button(actions, text="Sync artwork from files into DB", command=self._mik_sync_artwork).grid(
             row=2, column=0, sticky="ew", pady=4
         )
 
@@ -957,29 +1188,49 @@ class App(tk.Tk):
         if self._mik_db_cache_ready and not refresh:
             return self._mik_db_cache
 
+        # Path persisted by an earlier detect or Browse: one stat in the
+        # steady state, no walk at all.
+        cached = (self.settings.data.get("mik") or {}).get("db_path", "")
+        if cached:
+            pp = Path(cached)
+            if pp.exists():
+                self._mik_db_cache = pp
+                self._mik_db_cache_ready = True
+                return pp
+
         found: Path | None = None
         # Known default path for MIK 11
         candidate = Path(os.path.expandvars(r"%LOCALAPPDATA%\Mixed In Key\Mixed In Key\11.0\MIKStore.db"))
         if candidate.exists():
             found = candidate
         else:
-            # Scan for other versions
-            base = Path(os.path.expandvars(r"%LOCALAPPDATA%\Mixed In Key\Mixed In Key"))
-            if base.exists():
-                cands = list(base.glob("**/MIKStore.db"))
-                cands = [c for c in cands if c.is_file()]
-                if cands:
-                    # pick newest by modified time
-                    cands.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                    found = cands[0]
-
-            # manual path from settings
-            if found is None:
-                p = (self.settings.data.get("mik", {}) or {}).get("db_path", "")
-                if p:
-                    pp = Path(p)
-                    if pp.exists():
-                        found = pp
+            # Scan for other versions. The layout is <base>/<version>/MIKStore.db,
+            # so one bounded scandir pass beats a recursive glob over what can be
+            # a large cache directory.
+            base = os.path.expandvars(r"%LOCALAPPDATA%\Mixed In Key\Mixed In Key")
+            cands: list[tuple[float, str]] = []
+            try:
+                with os.scandir(base) as it:
+                    for ent in it:
+                        if not ent.is_dir(follow_symlinks=False):
+                            continue
+                        cand = os.path.join(ent.path, "MIKStore.db")
+                        try:
+                            cands.append((os.stat(cand).st_mtime, cand))
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            if cands:
+                # pick newest by modified time
+                found = Path(max(cands)[1])
+
+        if found is not None:
+            # Remember the detected path so future launches skip the walk.
+            mik = self.settings.data.setdefault("mik", {})
+            if mik.get("db_path") != str(found):
+                mik["db_path"] = str(found)
+                self._schedule_settings_save()
 
         self._mik_db_cache = found
         self._mik_db_cache_ready = True
@@ -993,7 +1244,7 @@ class App(tk.Tk):
         if p:
             self.mik_db_path.set(p)
             self.settings.data["mik"]["db_path"] = p
-            self.settings.save()
+            self._schedule_settings_save()
             self._mik_db_cache = Path(p)
             self._mik_db_cache_ready = True
 
@@ -1066,28 +1317,28 @@ class App(tk.Tk):
 
         row = 0
         ttk.Label(f, text="Rekordbox XML:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.rb_xml_path).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_rb_xml).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.rb_xml_path).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_rb_xml).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
         ttk.Label(f, text="Music root (optional, for relink):").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.rb_music_root).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_rb_root).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.rb_music_root).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_rb_root).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
         ttk.Label(f, text="MIK CSV (optional, compare):").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.rb_mik_csv).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_rb_mik).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.rb_mik_csv).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_rb_mik).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
         ttk.Label(f, text="Output folder:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.rb_outdir).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=self._browse_rb_outdir).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
+        self._mk_entry(f, textvariable=self.rb_outdir).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=self._browse_rb_outdir).grid(row=row, column=2, sticky="ew", padx=(8,0), pady=4)
 
         row += 1
         btns = ttk.Frame(f)
         btns.grid(row=row, column=0, columnspan=3, sticky="w", pady=(10,4))
-        ttk.Button(btns, text="Run full analysis", style="Primary.TButton", command=self._run_rekordbox_analysis).pack(side="left")
+        self._mk_button(btns, text="Run full analysis", style="Primary.TButton", command=self._run_rekordbox_analysis).pack(side="left")
 
         ttk.Label(f, text="This runs: overview, data quality, duplicates, playlists, missing files, artwork scan, and MIK compare (if provided).").grid(
             row=row+1, column=0, columnspan=3, sticky="w", pady=(6,0)
@@ -1139,14 +1390,8 @@ class App(tk.Tk):
             args += ["--mik-csv", mik]
 
         # Use Baseline settings so placeholder artwork can be detected
-        settings_fp = SETTINGS_PATH
-        if not settings_fp.exists():
-            for legacy_path in LEGACY_SETTINGS_PATHS:
-                if legacy_path.exists():
-                    settings_fp = legacy_path
-                    break
-        if settings_fp.exists():
-            args += ["--settings", str(settings_fp)]
+        if self._effective_settings_path is not None:
+            args += ["--settings", str(self._effective_settings_path)]
 
         self._run_tool("Rekordbox/rekordbox_analyse.py", args, "Rekordbox XML analysis")
 
@@ -1167,7 +1412,7 @@ class App(tk.Tk):
         row += 1
         top_actions = ttk.Frame(f)
         top_actions.grid(row=row, column=0, columnspan=3, sticky="ew", pady=(2, 10))
-        ttk.Button(top_actions, text="Save settings", style="Primary.TButton", command=self._save_settings).grid(row=0, column=0, sticky="w")
+        self._mk_button(top_actions, text="Save settings", style="Primary.TButton", command=self._save_settings).grid(row=0, column=0, sticky="w")
         ttk.Label(top_actions, text=f"Saves to: {SETTINGS_PATH}").grid(row=0, column=1, sticky="w", padx=(12, 0))
 
         row += 1
@@ -1182,18 +1427,18 @@ class App(tk.Tk):
         # Credentials
         self.set_discogs_key = tk.StringVar(value=str(discogs.get("consumer_key", "")))
         self.set_discogs_secret = tk.StringVar(value=str(discogs.get("consumer_secret", "")))
-        self.set_discogs_user_agent = tk.StringVar(value=str(discogs.get("user_agent", "Baseline (Music library maintenance for DJs)")))
+        self.set_discogs_user_agent = tk.StringVar(value=str(discogs.get("user_agent", DEFAULT_DISCOGS_USER_AGENT)))
 
         row += 1
         ttk.Label(f, text="Consumer key:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.set_discogs_key).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_entry(f, textvariable=self.set_discogs_key).grid(row=row, column=1, sticky="ew", pady=4)
 
         row += 1
         ttk.Label(f, text="Consumer secret:").grid(row=row, column=0, sticky="w", pady=4)
-        self._discogs_secret_entry = ttk.Entry(f, textvariable=self.set_discogs_secret, show="•")
+        self._discogs_secret_entry = self._mk_entry(f, textvariable=self.set_discogs_secret, show="•")
         self._discogs_secret_entry.grid(row=row, column=1, sticky="ew", pady=4)
         self.set_discogs_show_secret = tk.BooleanVar(value=False)
-        ttk.Checkbutton(
+        self._mk_check(
             f,
             text="Show",
             variable=self.set_discogs_show_secret,
@@ -1202,14 +1447,14 @@ class App(tk.Tk):
 
         row += 1
         ttk.Label(f, text="User-Agent:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.set_discogs_user_agent).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_entry(f, textvariable=self.set_discogs_user_agent).grid(row=row, column=1, sticky="ew", pady=4)
 
         row += 1
         help_txt = "How to get keys: Discogs website, Settings, Developers, Create an application, then copy your consumer key and secret."
         ttk.Label(f, text=help_txt, wraplength=720).grid(row=row, column=0, columnspan=3, sticky="w", pady=(0, 8))
 
         row += 1
-        ttk.Button(f, text="Test Discogs connection", command=self._test_discogs_connection).grid(row=row, column=0, sticky="w", pady=(0, 10))
+        self._mk_button(f, text="Test Discogs connection", command=self._test_discogs_connection).grid(row=row, column=0, sticky="w", pady=(0, 10))
 
         row += 1
         sep2 = ttk.Separator(f, orient="horizontal")
@@ -1223,10 +1468,10 @@ class App(tk.Tk):
 
         row += 1
         ttk.Label(f, text="Minimum artwork size (px):").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.set_discogs_min_art, width=10).grid(row=row, column=1, sticky="w", pady=4)
+        self._mk_entry(f, textvariable=self.set_discogs_min_art, width=10).grid(row=row, column=1, sticky="w", pady=4)
 
         row += 1
-        ttk.Checkbutton(
+        self._mk_check(
             f,
             text="Auto accept and resize Discogs artwork below minimum (not default)",
             variable=self.set_discogs_auto_small
@@ -1234,38 +1479,62 @@ class App(tk.Tk):
 
         row += 1
         ttk.Label(f, text="Placeholder image:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.set_discogs_placeholder).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=lambda: self._pick_image(self.set_discogs_placeholder)).grid(row=row, column=2, sticky="ew", padx=(8, 0), pady=4)
+        self._mk_entry(f, textvariable=self.set_discogs_placeholder).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=lambda: self._pick_image(self.set_discogs_placeholder)).grid(row=row, column=2, sticky="ew", padx=(8, 0), pady=4)
 
         row += 1
         ttk.Label(f, text="Fallback image:").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Entry(f, textvariable=self.set_discogs_fallback).grid(row=row, column=1, sticky="ew", pady=4)
-        ttk.Button(f, text="Browse", command=lambda: self._pick_image(self.set_discogs_fallback)).grid(row=row, column=2, sticky="ew", padx=(8, 0), pady=4)
+        self._mk_entry(f, textvariable=self.set_discogs_fallback).grid(row=row, column=1, sticky="ew", pady=4)
+        self._mk_button(f, text="Browse", command=lambda: self._pick_image(self.set_discogs_fallback)).grid(row=row, column=2, sticky="ew", padx=(8, 0), pady=4)
 
     def _toggle_discogs_secret_visibility(self):
         if getattr(self, "_discogs_secret_entry", None) is None:
             return
         self._discogs_secret_entry.configure(show="" if self.set_discogs_show_secret.get() else "•")
 
+    def _http_session(self):
+        # Shared pooled session: the first test handshake warms a TLS
+        # connection that later Discogs calls reuse.
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+
+            s = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            )
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            self._http = s
+        return self._http
+
     def _test_discogs_connection(self):
         key = self.set_discogs_key.get().strip()
         secret = self.set_discogs_secret.get().strip()
-        ua = self.set_discogs_user_agent.get().strip() or "Baseline (Music library maintenance for DJs)"
+        ua = self.set_discogs_user_agent.get().strip() or DEFAULT_DISCOGS_USER_AGENT
         if not key or not secret:
             messagebox.showerror("Discogs keys required", "Please enter your Discogs consumer key and consumer secret first.")
             return
+        # The request runs on a worker thread so the 15s timeout cannot
+        # freeze the event loop; the result dialog is posted back via after().
+        threading.Thread(target=self._do_discogs_test, args=(key, secret, ua), daemon=True).start()
+
+    def _do_discogs_test(self, key: str, secret: str, ua: str):
         try:
-            import requests
             url = "https://api.discogs.com/database/search"
             params = {"q": "test", "per_page": 1, "key": key, "secret": secret}
             headers = {"User-Agent": ua}
-            r = requests.get(url, params=params, headers=headers, timeout=15)
+            r = self._http_session().get(url, params=params, headers=headers, timeout=15)
             if r.status_code == 200:
-                messagebox.showinfo("Discogs OK", "Discogs connection successful. Click Save settings to store your keys.")
+                self.after(0, lambda: messagebox.showinfo("Discogs OK", "Discogs connection successful. Click Save settings to store your keys."))
             else:
-                messagebox.showerror("Discogs failed", f"Discogs request failed. HTTP {r.status_code}\\n\\n{r.text[:500]}")
+                msg = f"Discogs request failed. HTTP {r.status_code}\\n\\n{r.text[:500]}"
+                self.after(0, lambda m=msg: messagebox.showerror("Discogs failed", m))
         except Exception as e:
-            messagebox.showerror("Discogs failed", f"Discogs connection failed.\\n\\n{e}")
+            msg = f"Discogs connection failed.\\n\\n{e}"
+            self.after(0, lambda m=msg: messagebox.showerror("Discogs failed", m))
 
     def _pick_image(self, var: tk.StringVar):
         p = filedialog.askopenfilename(
@@ -1280,7 +1549,7 @@ class App(tk.Tk):
             d = self.settings.data.get("discogs", {}) or {}
             d["consumer_key"] = self.set_discogs_key.get().strip()
             d["consumer_secret"] = self.set_discogs_secret.get().strip()
-            d["user_agent"] = self.set_discogs_user_agent.get().strip() or "Baseline (Music library maintenance for DJs)"
+            d["user_agent"] = self.set_discogs_user_agent.get().strip() or DEFAULT_DISCOGS_USER_AGENT
             d["auto_accept_resize_small_art"] = bool(self.set_discogs_auto_small.get())
             d["placeholder_image"] = self.set_discogs_placeholder.get().strip()
             d["fallback_image"] = self.set_discogs_fallback.get().strip()
@@ -1296,6 +1565,7 @@ class App(tk.Tk):
 
             self.settings.data["discogs"] = d
             self.settings.save()
+            self._effective_settings_path = SETTINGS_PATH
             messagebox.showinfo("Saved", f"Settings saved.\n\nFile:\n{SETTINGS_PATH}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -21,12 +21,49 @@ Notes:
 """
 
 import sys
+import threading
 from pathlib import Path
 import importlib.util
 
 ROOT = Path(__file__).resolve().parent
 
+# Loaded tool modules keyed by (path, mtime), so repeat invocations in the
+# same process (e.g. from the GUI) skip the exec/import phase; the lock
+# keeps concurrent callers from executing the same module twice.
+_MODULE_CACHE: dict[tuple[str, int], object] = {}
+_MODULE_CACHE_LOCK = threading.Lock()
+
+# (group, tool) -> script path, built once at import; main() resolves
+# commands with a plain dict lookup.
+_TOOL_SCRIPTS: dict[tuple[str, str], Path] = {
+    ("mik", "prune-missing"): ROOT / "MixedinKey" / "mik_prune_missing.py",
+    ("mik", "sync-tags"): ROOT / "MixedinKey" / "mik_sync_tags_from_files.py",
+    ("mik", "sync-artwork"): ROOT / "MixedinKey" / "mik_sync_artwork.py",
+
+    ("discogs", "updateart"): ROOT / "Discogs" / "UpdateArt.py",
+    ("discogs", "years-labels-art"): ROOT / "Discogs" / "discogs_years_labels_art.py",
+    ("discogs", "art-only"): ROOT / "Discogs" / "discogs_art_only.py",
+    ("discogs", "playlistupdate"): ROOT / "Discogs" / "PlaylistUpdate.py",
+}
+
+# Existence results per script, so a long-lived driver calling main()
+# repeatedly stats each tool file at most once.
+_EXISTS_CACHE: dict[Path, bool] = {}
+
 def _load_module(module_path: Path, module_name: str):
+    try:
+        mtime_ns = module_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    key = (str(module_path), mtime_ns)
+    with _MODULE_CACHE_LOCK:
+        mod = _MODULE_CACHE.get(key)
+        if mod is not None:
+            sys.modules[module_name] = mod
+            return mod
+        return _load_module_uncached(module_path, module_name, key)
+
+def _load_module_uncached(module_path: Path, module_name: str, key: tuple[str, int]):
     spec = importlib.util.spec_from_file_location(module_name, str(module_path))
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Could not load module: {module_path}")
@@ -41,6 +78,7 @@ def _load_module(module_path: Path, module_name: str):
         else:
             sys.modules[module_name] = previous
         raise
+    _MODULE_CACHE[key] = mod
     return mod
 
 def _print_help():
@@ -77,26 +115,16 @@ def main() -> int:
     group = sys.argv[1].lower()
     tool  = sys.argv[2].lower() if len(sys.argv) > 2 else ""
 
-    mapping = {
-        ("mik", "prune-missing"): ROOT / "MixedinKey" / "mik_prune_missing.py",
-        ("mik", "sync-tags"): ROOT / "MixedinKey" / "mik_sync_tags_from_files.py",
-        ("mik", "sync-artwork"): ROOT / "MixedinKey" / "mik_sync_artwork.py",
-
-        ("discogs", "updateart"): ROOT / "Discogs" / "UpdateArt.py",
-        ("discogs", "years-labels-art"): ROOT / "Discogs" / "discogs_years_labels_art.py",
-        ("discogs", "art-only"): ROOT / "Discogs" / "discogs_art_only.py",
-        ("discogs", "playlistupdate"): ROOT / "Discogs" / "PlaylistUpdate.py",
-    }
-
-    key = (group, tool)
-    if key not in mapping:
+    script_path = _TOOL_SCRIPTS.get((group, tool))
+    if script_path is None:
         print(f"Unknown command: {group} {tool}")
         print()
         _print_help()
         return 2
 
-    script_path = mapping[key]
-    if not script_path.exists():
+    if script_path not in _EXISTS_CACHE:
+        _EXISTS_CACHE[script_path] = script_path.exists()
+    if not _EXISTS_CACHE[script_path]:
         print(f"ERROR: Tool script not found: {script_path}")
         return 2
 